@@ -0,0 +1,77 @@
+import glob
+import heapq
+import os
+from concurrent.futures import FIRST_COMPLETED, wait
+
+PRIORITIES = ("changed_first", "small_first", "fifo")
+DEFAULT_OUTPUT_PATTERN = "{stem}_{locale}.properties"
+
+
+def locale_suffix(lang_code):
+    parts = lang_code.split('-')
+    if len(parts) == 2:
+        return f"{parts[0]}_{parts[1].upper()}"
+    return lang_code
+
+
+def is_localized_file(path, lang_codes):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return any(stem.endswith('_' + locale_suffix(code)) for code in lang_codes)
+
+
+def discover_sources(pattern, lang_codes):
+    if os.path.isdir(pattern):
+        paths = []
+        for root, dirs, files in os.walk(pattern):
+            dirs.sort()
+            paths.extend(os.path.join(root, name) for name in sorted(files) if name.endswith('.properties'))
+    else:
+        paths = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+
+    return [path for path in paths if not is_localized_file(path, lang_codes)]
+
+
+def target_output_path(source_path, lang_code, pattern=DEFAULT_OUTPUT_PATTERN):
+    directory, name = os.path.split(source_path)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(directory, pattern.format(stem=stem, locale=locale_suffix(lang_code), code=lang_code))
+
+
+def is_stale(source_path, output_path):
+    if not os.path.exists(output_path):
+        return True
+    return os.path.getmtime(source_path) > os.path.getmtime(output_path)
+
+
+def file_priority(policy, index, size, changed):
+    if policy == "fifo":
+        return (index,)
+    if policy == "small_first":
+        return (size, index)
+    return (0 if changed else 1, size, index)
+
+
+class JobScheduler:
+    def __init__(self, executor, max_pending):
+        self.executor = executor
+        self.max_pending = max(1, max_pending)
+        self.queue = []
+        self.submitted = 0
+        self._sequence = 0
+
+    def add(self, priority, on_done, fn, *args):
+        heapq.heappush(self.queue, (priority, self._sequence, on_done, fn, args))
+        self._sequence += 1
+
+    def run(self):
+        running = {}
+        while self.queue or running:
+            while self.queue and len(running) < self.max_pending:
+                priority, sequence, on_done, fn, args = heapq.heappop(self.queue)
+                running[self.executor.submit(fn, *args)] = on_done
+                self.submitted += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                on_done = running.pop(future)
+                on_done(future.result())
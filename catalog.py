@@ -0,0 +1,177 @@
+import mmap
+import os
+import struct
+
+from incremental import index_entries
+from properties_io import iter_properties
+
+CATALOG_MAGIC = b"LCAT"
+CATALOG_VERSION = 1
+HEADER = struct.Struct("<4sIIII")
+INDEX_ENTRY = struct.Struct("<IIII")
+
+MO_MAGIC = 0x950412de
+MO_HEADER = struct.Struct("<7I")
+MO_METADATA = "Content-Type: text/plain; charset=UTF-8\n"
+
+EXPORT_EXTENSIONS = {
+    "catalog": ".lcat",
+    "mo": ".mo"
+}
+
+
+def export_path(output_path, export_format):
+    return os.path.splitext(output_path)[0] + EXPORT_EXTENSIONS[export_format]
+
+
+def _write_atomic(path, chunks):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def build_catalog(translations):
+    items = sorted((key.encode('utf-8'), value.encode('utf-8')) for key, value in translations.items())
+    pool = bytearray()
+    offsets = {}
+
+    def intern(data):
+        if data not in offsets:
+            offsets[data] = len(pool)
+            pool.extend(data)
+        return offsets[data]
+
+    index = bytearray()
+    for key, value in items:
+        index += INDEX_ENTRY.pack(intern(key), len(key), intern(value), len(value))
+
+    index_offset = HEADER.size
+    pool_offset = index_offset + len(index)
+    header = HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(items), index_offset, pool_offset)
+    return [header, bytes(index), bytes(pool)]
+
+
+def write_catalog(path, translations):
+    _write_atomic(path, build_catalog(translations))
+
+
+def build_mo(translations):
+    items = sorted((key.encode('utf-8'), value.encode('utf-8')) for key, value in translations.items() if key)
+    items.insert(0, (b"", MO_METADATA.encode('utf-8')))
+
+    count = len(items)
+    originals_offset = MO_HEADER.size
+    translations_offset = originals_offset + count * 8
+    strings_offset = translations_offset + count * 8
+
+    originals = bytearray()
+    translated = bytearray()
+    strings = bytearray()
+    for column, table in ((0, originals), (1, translated)):
+        for item in items:
+            data = item[column]
+            table += struct.pack("<II", len(data), strings_offset + len(strings))
+            strings += data + b"\0"
+
+    header = MO_HEADER.pack(MO_MAGIC, 0, count, originals_offset, translations_offset, 0, 0)
+    return [header, bytes(originals), bytes(translated), bytes(strings)]
+
+
+def write_mo(path, translations):
+    _write_atomic(path, build_mo(translations))
+
+
+WRITERS = {
+    "catalog": write_catalog,
+    "mo": write_mo
+}
+
+
+def export_properties(properties_path, formats):
+    with open(properties_path, 'r', encoding='utf-8') as f:
+        translations = index_entries(iter_properties(f))
+
+    paths = []
+    for export_format in formats:
+        path = export_path(properties_path, export_format)
+        WRITERS[export_format](path, translations)
+        paths.append(path)
+    return paths
+
+
+class Catalog:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.count, self._index_offset, self._pool_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != CATALOG_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a localization catalog")
+        if version != CATALOG_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported catalog version {version} in {path}")
+
+    def _entry(self, position):
+        return INDEX_ENTRY.unpack_from(self._mmap, self._index_offset + position * INDEX_ENTRY.size)
+
+    def _string(self, offset, length):
+        start = self._pool_offset + offset
+        return self._mmap[start:start + length]
+
+    def _find(self, key):
+        key = key.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            key_offset, key_length, value_offset, value_length = self._entry(middle)
+            current = self._string(key_offset, key_length)
+            if current < key:
+                low = middle + 1
+            elif current > key:
+                high = middle
+            else:
+                return value_offset, value_length
+        return None
+
+    def get(self, key, default=None):
+        found = self._find(key)
+        if found is None:
+            return default
+        return self._string(*found).decode('utf-8')
+
+    def __getitem__(self, key):
+        found = self._find(key)
+        if found is None:
+            raise KeyError(key)
+        return self._string(*found).decode('utf-8')
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self.count
+
+    def items(self):
+        for position in range(self.count):
+            key_offset, key_length, value_offset, value_length = self._entry(position)
+            yield (self._string(key_offset, key_length).decode('utf-8'),
+                   self._string(value_offset, value_length).decode('utf-8'))
+
+    def keys(self):
+        for key, value in self.items():
+            yield key
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,63 @@
+import random
+import threading
+import time
+
+
+class FakeTranslation:
+    def __init__(self, text, dest, src='auto'):
+        self.text = text
+        self.dest = dest
+        self.src = src
+
+
+class RateLimitExceeded(Exception):
+    pass
+
+
+class FakeRateLimit:
+    def __init__(self, requests_per_second):
+        self.requests_per_second = requests_per_second
+        self.rejected = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._lock = threading.Lock()
+
+    def check(self):
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            if self._window_count > self.requests_per_second:
+                self.rejected += 1
+                raise RateLimitExceeded("429 Too Many Requests (simulated)")
+
+
+class FakeTranslator:
+    def __init__(self, latency=0.0, failure_rate=0.0, seed=None, rate_limit=None, latency_jitter=0.0):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.failure_rate = failure_rate
+        self.rate_limit = rate_limit
+        self.calls = 0
+        self.characters = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def translate(self, text, dest='en', src='auto'):
+        with self._lock:
+            self.calls += 1
+            self.characters += len(text)
+            fail = self._random.random() < self.failure_rate
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+
+        if self.rate_limit is not None:
+            self.rate_limit.check()
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise ConnectionError("Simulated transient translation failure")
+
+        lines = [f"[{dest}] {line}" if line.strip() else line for line in text.split("\n")]
+        return FakeTranslation("\n".join(lines), dest, src)
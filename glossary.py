@@ -0,0 +1,89 @@
+import json
+import os
+import re
+import threading
+
+from placeholders import TOKEN_FORMAT, mask_placeholders, strip_tokens, unmask_placeholders
+
+
+def build_trie(terms):
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return trie
+
+
+def trie_pattern(node):
+    optional = '' in node
+    branches = [re.escape(char) + trie_pattern(node[char]) for char in sorted(key for key in node if key)]
+    if not branches:
+        return ''
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    pattern = '(?:' + '|'.join(branches) + ')'
+    return pattern + '?' if optional else pattern
+
+
+def compile_terms(terms, ignore_case=False):
+    terms = [term.lower() if ignore_case else term for term in terms if term]
+    if not terms:
+        return None
+    flags = re.IGNORECASE if ignore_case else 0
+    return re.compile(r'(?<!\w)' + trie_pattern(build_trie(terms)) + r'(?!\w)', flags)
+
+
+class Glossary:
+    def __init__(self, protected=None, terms=None, ignore_case=False):
+        self.protected = list(protected or [])
+        self.terms = terms or {}
+        self.ignore_case = ignore_case
+        self._matchers = {}
+        self._lock = threading.Lock()
+
+    def normalize(self, term):
+        return term.lower() if self.ignore_case else term
+
+    def matcher(self, target_lang):
+        with self._lock:
+            if target_lang not in self._matchers:
+                targets = {self.normalize(term): None for term in self.protected}
+                for term, translations in self.terms.items():
+                    if target_lang in translations:
+                        targets[self.normalize(term)] = translations[target_lang]
+                self._matchers[target_lang] = (compile_terms(targets, self.ignore_case), targets)
+            return self._matchers[target_lang]
+
+    def mask(self, text, target_lang, tokens):
+        pattern, targets = self.matcher(target_lang)
+        if pattern is None:
+            return text
+
+        def replace(match):
+            forced = targets[self.normalize(match.group(0))]
+            tokens.append(match.group(0) if forced is None else forced)
+            return TOKEN_FORMAT.format(len(tokens) - 1)
+
+        return pattern.sub(replace, text)
+
+    def resolve(self, value, target_lang):
+        masked, tokens = mask_placeholders(value)
+        placeholder_count = len(tokens)
+        masked = self.mask(masked, target_lang, tokens)
+        if len(tokens) == placeholder_count:
+            return None
+        if any(char.isalpha() for char in strip_tokens(masked)):
+            return None
+        return unmask_placeholders(masked, tokens)
+
+
+def load_glossary(path):
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Glossary {path} must contain a JSON object")
+    return Glossary(data.get("protected", []), data.get("terms", {}), data.get("ignore_case", False))
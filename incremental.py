@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+
+from properties_io import SPECIAL_KEYS, format_entry
+
+MANIFEST_VERSION = 1
+
+
+def source_hash(value):
+    return hashlib.sha1(value.encode('utf-8')).hexdigest()[:16]
+
+
+def manifest_path(output_path):
+    return output_path + ".manifest.json"
+
+
+def load_manifest(output_path):
+    path = manifest_path(output_path)
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("source_hashes", {})
+    except Exception:
+        pass
+
+    return {}
+
+
+def save_manifest(output_path, source_hashes):
+    path = manifest_path(output_path)
+    temp_path = path + ".tmp"
+
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump({"version": MANIFEST_VERSION, "source_hashes": source_hashes}, f,
+                  indent=2, ensure_ascii=False, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def index_entries(entries):
+    index = {}
+    for key, value in entries:
+        if key not in SPECIAL_KEYS:
+            index[key] = value
+    return index
+
+
+class Delta:
+    def __init__(self, added, changed, removed, unchanged):
+        self.added = added
+        self.changed = changed
+        self.removed = removed
+        self.unchanged = unchanged
+
+    def keys_to_translate(self):
+        return self.added + self.changed
+
+    def counts(self):
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": len(self.unchanged)
+        }
+
+
+def compute_delta(source_index, output_index, manifest, remove_missing=True):
+    added = []
+    changed = []
+    unchanged = []
+
+    for key, value in source_index.items():
+        if key not in output_index:
+            added.append(key)
+        elif key in manifest and manifest[key] != source_hash(value):
+            changed.append(key)
+        else:
+            # Keys written before a manifest existed are trusted as-is.
+            unchanged.append(key)
+
+    removed = []
+    if remove_missing:
+        removed = [key for key in output_index if key not in source_index]
+
+    return Delta(added, changed, removed, unchanged)
+
+
+def render_source_lines(source_entries, updates):
+    lines = []
+    for key, value in source_entries:
+        if key == '__COMMENT__':
+            lines.append(value)
+        elif key == '__EMPTY_LINE__':
+            lines.append('')
+        elif key in updates:
+            lines.append(format_entry(key, updates[key]))
+    return lines
+
+
+def merge_output_lines(source_entries, output_entries, updates, removed):
+    removed = set(removed)
+    latest_values = index_entries(output_entries)
+    lines = []
+    key_positions = {}
+
+    for key, value in output_entries:
+        if key == '__COMMENT__':
+            lines.append(value)
+        elif key == '__EMPTY_LINE__':
+            lines.append('')
+        elif key in removed or key in key_positions:
+            continue
+        else:
+            key_positions[key] = len(lines)
+            lines.append(format_entry(key, updates.get(key, latest_values[key])))
+
+    # New keys go right after the closest preceding source key that is
+    # already in the output, so the file keeps following the source order.
+    inserts = {}
+    anchor = None
+    for key, value in source_entries:
+        if key in SPECIAL_KEYS:
+            continue
+        if key in key_positions:
+            anchor = key
+        elif key in updates:
+            inserts.setdefault(anchor, []).append(format_entry(key, updates[key]))
+
+    if not inserts:
+        return lines
+
+    keys_by_position = {position: key for key, position in key_positions.items()}
+    first_key_position = min(keys_by_position) if keys_by_position else len(lines)
+    merged = []
+    for position, line in enumerate(lines):
+        if position == first_key_position:
+            merged.extend(inserts.get(None, []))
+        merged.append(line)
+        if position in keys_by_position:
+            merged.extend(inserts.get(keys_by_position[position], []))
+    if first_key_position == len(lines):
+        merged.extend(inserts.get(None, []))
+
+    return merged
@@ -0,0 +1,212 @@
+import cProfile
+import json
+import pstats
+import random
+import threading
+import time
+from contextlib import contextmanager
+
+MAX_SAMPLES = 5000
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Timing:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = []
+        self._random = random.Random(0)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(seconds)
+        else:
+            slot = self._random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = seconds
+
+    def summary(self):
+        samples = sorted(self.samples)
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total, 6),
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else None,
+            "p50_ms": round(percentile(samples, 0.5) * 1000, 3) if samples else None,
+            "p90_ms": round(percentile(samples, 0.9) * 1000, 3) if samples else None,
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 3) if samples else None,
+            "max_ms": round(self.max * 1000, 3)
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.counters = {}
+            self.timings = {}
+            self.latencies = {}
+            self.started = None
+
+    def start(self):
+        with self._lock:
+            if self.started is None:
+                self.started = time.perf_counter()
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name, seconds):
+        with self._lock:
+            if name not in self.timings:
+                self.timings[name] = Timing()
+            self.timings[name].add(seconds)
+
+    def record_request(self, backend, language, seconds):
+        with self._lock:
+            if (backend, language) not in self.latencies:
+                self.latencies[(backend, language)] = Timing()
+            self.latencies[(backend, language)].add(seconds)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed_iter(self, name, iterable):
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.record(name, time.perf_counter() - start)
+                return
+            self.record(name, time.perf_counter() - start)
+            yield item
+
+    def report(self, **extra):
+        with self._lock:
+            duration = time.perf_counter() - self.started if self.started is not None else 0.0
+            counters = dict(self.counters)
+            timings = {name: timing.summary() for name, timing in sorted(self.timings.items())}
+            latencies = [dict({"backend": backend, "language": language}, **timing.summary())
+                         for (backend, language), timing in sorted(self.latencies.items())]
+
+        hits = counters.get("cache_hits", 0)
+        lookups = hits + counters.get("cache_misses", 0)
+        report = {
+            "duration_seconds": round(duration, 3),
+            "requests": counters.get("requests", 0),
+            "requests_per_second": round(counters.get("requests", 0) / duration, 2) if duration else None,
+            "cache_hit_ratio": round(hits / lookups, 4) if lookups else None,
+            "bytes_written": counters.get("bytes_written", 0),
+            "counters": counters,
+            "timings": timings,
+            "request_latency": latencies
+        }
+        report.update(extra)
+        return report
+
+
+def format_report(report):
+    lines = [
+        f"Duration: {report['duration_seconds']}s",
+        f"Requests: {report['requests']} ({report['requests_per_second'] or 0} req/s)",
+        f"Cache hit ratio: {report['cache_hit_ratio'] if report['cache_hit_ratio'] is not None else '-'}",
+        f"Bytes written: {report['bytes_written']}",
+        ""
+    ]
+
+    lines.append("Counters:")
+    for name, value in sorted(report["counters"].items()):
+        lines.append(f"  {name:<24} {value}")
+
+    lines.append("")
+    lines.append(f"{'Timer':<24} {'count':>8} {'total s':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, timing in report["timings"].items():
+        lines.append(f"{name:<24} {timing['count']:>8} {timing['total_seconds']:>10.3f} {timing['p50_ms']:>9} "
+                     f"{timing['p90_ms']:>9} {timing['p99_ms']:>9} {timing['max_ms']:>9}")
+
+    lines.append("")
+    lines.append(f"{'Backend / language':<24} {'count':>8} {'mean ms':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for latency in report["request_latency"]:
+        name = f"{latency['backend']} / {latency['language']}"
+        lines.append(f"{name:<24} {latency['count']:>8} {latency['mean_ms']:>10} {latency['p50_ms']:>9} "
+                     f"{latency['p90_ms']:>9} {latency['p99_ms']:>9} {latency['max_ms']:>9}")
+
+    if report.get("profile_path"):
+        lines.append("")
+        lines.append(f"cProfile stats: {report['profile_path']}")
+    return "\n".join(lines)
+
+
+def save_report(report, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+
+class ProfileCapture:
+    def __init__(self, path):
+        self.path = path
+        self.profiles = []
+        self.skipped = 0
+        self._main = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._main is not None:
+            return
+        self._main = cProfile.Profile()
+        try:
+            self._main.enable()
+        except ValueError:
+            self._main = None
+
+    def run(self, fn, *args):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            with self._lock:
+                self.skipped += 1
+            return fn(*args)
+        try:
+            return fn(*args)
+        finally:
+            profile.disable()
+            with self._lock:
+                self.profiles.append(profile)
+
+    def stop(self):
+        if self._main is not None:
+            self._main.disable()
+            self.profiles.append(self._main)
+            self._main = None
+
+        profiles = [profile for profile in self.profiles if profile.getstats()]
+        self.profiles = []
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(self.path)
+        return self.path
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+LOOKUP_BATCH = 500
+
+
+def run_fingerprint(*parts):
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(json.dumps(part, ensure_ascii=False, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class JobJournal:
+    def __init__(self, db_path="job_journal.db"):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            "run_id TEXT PRIMARY KEY, "
+            "started REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completed ("
+            "run_id TEXT NOT NULL, "
+            "output_path TEXT NOT NULL, "
+            "entry_key TEXT NOT NULL, "
+            "language TEXT NOT NULL, "
+            "source_value TEXT NOT NULL, "
+            "translated_text TEXT NOT NULL, "
+            "PRIMARY KEY (run_id, output_path, entry_key))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS written ("
+            "run_id TEXT NOT NULL, "
+            "output_path TEXT NOT NULL, "
+            "PRIMARY KEY (run_id, output_path))"
+        )
+        self._conn.commit()
+
+    def begin(self, run_id):
+        with self._lock:
+            existing = self._conn.execute("SELECT 1 FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if existing is None:
+                self._conn.execute("INSERT INTO runs (run_id, started) VALUES (?, ?)", (run_id, time.time()))
+                self._conn.commit()
+            return existing is not None
+
+    def record_many(self, run_id, output_path, language, rows):
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO completed "
+                "(run_id, output_path, entry_key, language, source_value, translated_text) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, output_path, key, language, value, translated) for key, value, translated in rows]
+            )
+            self._conn.commit()
+
+    def lookup(self, run_id, output_path, entries):
+        values = dict(entries)
+        keys = list(values)
+        completed = {}
+
+        with self._lock:
+            for start in range(0, len(keys), LOOKUP_BATCH):
+                batch = keys[start:start + LOOKUP_BATCH]
+                rows = self._conn.execute(
+                    "SELECT entry_key, source_value, translated_text FROM completed "
+                    f"WHERE run_id = ? AND output_path = ? AND entry_key IN ({','.join('?' * len(batch))})",
+                    [run_id, output_path] + batch
+                ).fetchall()
+                for key, value, translated in rows:
+                    if values[key] == value:
+                        completed[key] = translated
+
+        return completed
+
+    def mark_written(self, run_id, output_path):
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO written (run_id, output_path) VALUES (?, ?)",
+                               (run_id, output_path))
+            self._conn.commit()
+
+    def is_written(self, run_id, output_path):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM written WHERE run_id = ? AND output_path = ?",
+                                      (run_id, output_path)).fetchone() is not None
+
+    def finish(self, run_id):
+        with self._lock:
+            for table in ("completed", "written", "runs"):
+                self._conn.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
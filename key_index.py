@@ -0,0 +1,48 @@
+from properties_io import SPECIAL_KEYS
+
+
+class KeyIndex:
+    def __init__(self, entries=()):
+        self.keys = []
+        self.values = []
+        self.failed = set()
+        self._search = []
+        self.load(entries)
+
+    def load(self, entries):
+        self.keys = []
+        self.values = []
+        self._search = []
+        self.failed = set()
+        for key, value in entries:
+            if key in SPECIAL_KEYS:
+                continue
+            self.keys.append(key)
+            self.values.append(value)
+            self._search.append(f"{key}\n{value}".lower())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def row(self, index):
+        return self.keys[index], self.values[index]
+
+    def mark_failed(self, key, language):
+        self.failed.add((key, language))
+
+    def is_failed(self, key, language):
+        return (key, language) in self.failed
+
+    def clear_failed(self):
+        self.failed = set()
+
+    def filter(self, text="", failed_only=False):
+        rows = range(len(self.keys))
+        if failed_only:
+            failed_keys = {key for key, language in self.failed}
+            rows = [index for index in rows if self.keys[index] in failed_keys]
+        text = text.strip().lower()
+        if text:
+            search = self._search
+            rows = [index for index in rows if text in search[index]]
+        return list(rows)
@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+from batch_scheduler import DEFAULT_OUTPUT_PATTERN, PRIORITIES, discover_sources, target_output_path
+from localizer_engine import LANGUAGES, LocalizationEngine, get_enabled_combinations, load_settings
+from catalog import EXPORT_EXTENSIONS, export_properties
+from instrumentation import save_report
+from properties_io import iter_properties
+from settings_store import SettingsError
+from translation_backends import BACKENDS
+from verification import summarize, verification_options, verification_tasks, verify_outputs
+
+
+class JsonLinesReporter:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        event = dict(event, time=round(time.time(), 3))
+        line = json.dumps(event, ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+def add_run_options(parser):
+    parser.add_argument("--config", default="localizer_settings.json",
+                        help="Settings file with language combinations (default: localizer_settings.json)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Number of concurrent translation workers (default: max_workers from the config)")
+    parser.add_argument("--language", action="append", default=None,
+                        help="Only translate this language; can be given more than once")
+    parser.add_argument("--incremental", action="store_true", default=None,
+                        help="Only translate new or changed keys and rewrite the outputs in place")
+    parser.add_argument("--backend", action="append", default=None,
+                        help="Translation backend to use; repeat to set a failover order (default: translation_backends from the config)")
+    parser.add_argument("--no-resume", dest="resume", action="store_false",
+                        help="Start over instead of resuming an interrupted run of the same input")
+    parser.add_argument("--report", default=None,
+                        help="Write the run's performance report to this JSON file")
+    parser.add_argument("--profile", default=None,
+                        help="Capture cProfile stats for the run into this file (view with python -m pstats)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="localizer",
+        description="Translate localization files without the GUI."
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    translate = subparsers.add_parser("translate", help="Translate a .properties file into the configured languages")
+    translate.add_argument("input", help="Source .properties file")
+    add_run_options(translate)
+
+    batch = subparsers.add_parser("batch", help="Translate every source .properties file in a directory or glob")
+    batch.add_argument("source", help="Directory to search recursively, or a glob such as 'modules/**/messages.properties'")
+    add_run_options(batch)
+    batch.add_argument("--priority", choices=PRIORITIES, default=None,
+                       help="Order in which files are scheduled (default: batch_priority from the config)")
+    batch.add_argument("--output-pattern", default=None,
+                       help=f"Output file name next to each source (default: batch_output_pattern from the config, "
+                            f"or '{DEFAULT_OUTPUT_PATTERN}')")
+
+    export = subparsers.add_parser("export", help="Compile .properties files into binary catalogs for fast loading")
+    export.add_argument("inputs", nargs="+", help=".properties files to compile")
+    export.add_argument("--format", dest="formats", action="append", choices=sorted(EXPORT_EXTENSIONS), default=None,
+                        help="Output format; can be given more than once (default: catalog)")
+
+    verify = subparsers.add_parser("verify", help="Check generated outputs against their source files")
+    verify.add_argument("source", help="Source .properties file, or a directory or glob of sources as in batch mode")
+    verify.add_argument("--config", default="localizer_settings.json",
+                        help="Settings file with language combinations (default: localizer_settings.json)")
+    verify.add_argument("--jobs", type=int, default=None,
+                        help="Number of verification processes (default: one per CPU)")
+    verify.add_argument("--language", action="append", default=None,
+                        help="Only verify this language; can be given more than once")
+    verify.add_argument("--output-pattern", default=None,
+                        help="Output file name next to each source when verifying a directory or glob "
+                             "(default: batch_output_pattern from the config)")
+    verify.add_argument("--max-length-ratio", type=float, default=None,
+                        help="Flag translations longer than this many times their source "
+                             "(default: verify_max_length_ratio from the config)")
+    verify.add_argument("--repair", action="store_true",
+                        help="Translate the failing keys again and rewrite the affected outputs in place")
+    verify.add_argument("--backend", action="append", default=None,
+                        help="Translation backend to use for --repair; repeat to set a failover order")
+    verify.add_argument("--report", default=None,
+                        help="Write the verification results to this JSON file")
+    verify.set_defaults(profile=None)
+
+    backends = subparsers.add_parser("backends", help="List the available translation backends and their capabilities")
+    backends.add_argument("--config", default="localizer_settings.json",
+                          help="Settings file with backend options (default: localizer_settings.json)")
+
+    return parser
+
+
+def run_export(args, reporter):
+    status = 0
+    for path in args.inputs:
+        try:
+            for exported in export_properties(path, args.formats or ["catalog"]):
+                reporter({"event": "exported", "output_path": path, "path": exported})
+        except Exception as e:
+            reporter({"event": "error", "message": f"Failed to export {path}: {str(e)}"})
+            status = 1
+    return status
+
+
+def run_backends(args, reporter):
+    try:
+        options = load_settings(args.config).get("backend_options", {})
+    except SettingsError as e:
+        reporter({"event": "error", "message": str(e)})
+        return 2
+    for name in sorted(BACKENDS):
+        try:
+            capabilities = BACKENDS[name](options.get(name)).capabilities()
+        except Exception as e:
+            capabilities = {"name": name, "error": str(e)}
+        reporter(dict({"event": "backend"}, **capabilities))
+    return 0
+
+
+def load_run_settings(args, reporter):
+    try:
+        settings = load_settings(args.config)
+    except SettingsError as e:
+        reporter({"event": "error", "message": str(e)})
+        return None, None
+    if args.backend:
+        settings["translation_backends"] = args.backend
+    if args.profile:
+        settings["profile_path"] = args.profile
+    combinations = get_enabled_combinations(settings)
+
+    if args.language:
+        unknown = [language for language in args.language if language not in LANGUAGES]
+        if unknown:
+            reporter({"event": "error", "message": f"Unknown language(s): {', '.join(unknown)}"})
+            return settings, None
+        combinations = [combo for combo in combinations if combo[0] in args.language]
+
+    if not combinations:
+        reporter({"event": "error", "message": "No enabled language combinations to translate"})
+        return settings, None
+
+    return settings, combinations
+
+
+def create_engine(settings, args, reporter):
+    try:
+        return LocalizationEngine(settings, max_workers=args.jobs)
+    except Exception as e:
+        reporter({"event": "error", "message": str(e)})
+        return None
+
+
+def run_translate(args, reporter):
+    settings, combinations = load_run_settings(args, reporter)
+    if combinations is None:
+        return 2
+
+    if not os.path.isfile(args.input):
+        reporter({"event": "error", "message": f"Input file not found: {args.input}"})
+        return 2
+
+    incremental = args.incremental if args.incremental is not None else settings.get("incremental", False)
+    warn = lambda message: reporter({"event": "warning", "message": message})
+
+    engine = create_engine(settings, args, reporter)
+    if engine is None:
+        return 2
+
+    try:
+        if incremental:
+            with engine.metrics.timer("parse"), open(args.input, 'r', encoding='utf-8') as f:
+                entries = list(iter_properties(f, warn))
+            if not entries:
+                reporter({"event": "error", "message": "No valid entries found to translate"})
+                return 1
+            summary = engine.translate_and_save([(combo, entries) for combo in combinations], reporter,
+                                                incremental=True, resume=args.resume)
+        else:
+            summary = engine.translate_file(args.input, combinations, reporter, resume=args.resume)
+        if args.report:
+            save_report(engine.last_report, args.report)
+    except Exception as e:
+        reporter({"event": "error", "message": str(e)})
+        return 1
+    finally:
+        engine.close()
+
+    return 1 if summary["failed"] else 0
+
+
+def find_batch_sources(args, settings, combinations, reporter):
+    source_language = settings.get("source_language", "English")
+    languages = [language for language in dict.fromkeys(combo[0] for combo in combinations)
+                 if language != source_language]
+    if not languages:
+        reporter({"event": "error", "message": "No target languages to translate"})
+        return None
+
+    paths = discover_sources(args.source, LANGUAGES.values())
+    if not paths:
+        reporter({"event": "error", "message": f"No source .properties files found in {args.source}"})
+        return None
+
+    pattern = args.output_pattern or settings.get("batch_output_pattern", DEFAULT_OUTPUT_PATTERN)
+    return [(path, [(language, target_output_path(path, LANGUAGES[language], pattern))
+                    for language in languages])
+            for path in paths]
+
+
+def run_batch(args, reporter):
+    settings, combinations = load_run_settings(args, reporter)
+    if combinations is None:
+        return 2
+
+    sources = find_batch_sources(args, settings, combinations, reporter)
+    if sources is None:
+        return 2
+
+    engine = create_engine(settings, args, reporter)
+    if engine is None:
+        return 2
+
+    try:
+        summary = engine.translate_batch(sources, reporter, incremental=args.incremental, priority=args.priority,
+                                         resume=args.resume)
+        if args.report:
+            save_report(engine.last_report, args.report)
+    except Exception as e:
+        reporter({"event": "error", "message": str(e)})
+        return 1
+    finally:
+        engine.close()
+
+    return 1 if summary["failed"] else 0
+
+
+def report_verification(results, reporter, started):
+    for result in results:
+        issues = {name: keys for name, keys in result["issues"].items() if keys}
+        reporter({"event": "verified", "source_path": result["source_path"], "language": result["language"],
+                  "output_path": result["output_path"], "exists": result["exists"], "keys": result["keys"],
+                  "passed": not issues, "issues": issues})
+    summary = summarize(results)
+    summary["duration_seconds"] = round(time.perf_counter() - started, 3)
+    reporter(dict({"event": "verification_finished"}, **summary))
+    return summary
+
+
+def run_verify(args, reporter):
+    settings, combinations = load_run_settings(args, reporter)
+    if combinations is None:
+        return 2
+
+    if os.path.isfile(args.source):
+        sources = [(args.source, combinations)]
+    else:
+        sources = find_batch_sources(args, settings, combinations, reporter)
+        if sources is None:
+            return 2
+
+    if args.max_length_ratio is not None:
+        settings["verify_max_length_ratio"] = args.max_length_ratio
+
+    tasks = verification_tasks(sources, LANGUAGES, settings.get("source_language", "English"))
+    options = verification_options(settings)
+    engine = None
+
+    try:
+        started = time.perf_counter()
+        results = verify_outputs(tasks, options, args.jobs)
+        summary = report_verification(results, reporter, started)
+        if args.repair and summary["failed_files"]:
+            engine = create_engine(settings, args, reporter)
+            if engine is None:
+                return 2
+            engine.repair_outputs(results, reporter)
+            started = time.perf_counter()
+            results = verify_outputs(tasks, options, args.jobs)
+            summary = report_verification(results, reporter, started)
+        if args.report:
+            save_report({"summary": summary, "results": results}, args.report)
+    except Exception as e:
+        reporter({"event": "error", "message": str(e)})
+        return 1
+    finally:
+        if engine is not None:
+            engine.close()
+
+    return 1 if summary["failed_files"] else 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "translate":
+        return run_translate(args, JsonLinesReporter())
+    if args.command == "batch":
+        return run_batch(args, JsonLinesReporter())
+    if args.command == "export":
+        return run_export(args, JsonLinesReporter())
+    if args.command == "verify":
+        return run_verify(args, JsonLinesReporter())
+    if args.command == "backends":
+        return run_backends(args, JsonLinesReporter())
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
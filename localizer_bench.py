@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from fake_translator import FakeRateLimit, FakeTranslator
+from localizer_engine import LANGUAGES, LocalizationEngine, parse_localization_entries
+from properties_io import AtomicPropertiesWriter, format_entry, iter_properties
+
+WORDS = ["account", "cancel", "save", "settings", "welcome", "error", "file", "invalid", "please",
+         "log", "in", "out", "user", "password", "network", "retry", "open", "close", "report", "delete"]
+COMMON_VALUES = ["OK", "Cancel", "Save", "Close", "Delete", "Yes", "No", "Retry"]
+
+
+def generate_corpus(path, keys, seed=0):
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for index in range(keys):
+            if index % 50 == 0:
+                f.write(f"\n# Section {index // 50}\n")
+            roll = rng.random()
+            if roll < 0.3:
+                value = rng.choice(COMMON_VALUES)
+            elif roll < 0.4:
+                value = f"Hello {{0}}, you have {rng.randint(1, 99)} new %s"
+            else:
+                value = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 12))).capitalize()
+            f.write(format_entry(f"module{index % 37}.screen{index % 11}.key{index}", value) + "\n")
+
+
+def measure_parse(path):
+    start = time.perf_counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        streamed = sum(1 for _ in iter_properties(f))
+    stream_seconds = time.perf_counter() - start
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start = time.perf_counter()
+    entries = parse_localization_entries(text)
+    text_seconds = time.perf_counter() - start
+
+    return {"entries": streamed, "stream_seconds": stream_seconds, "text_seconds": text_seconds}, entries
+
+
+def measure_write(entries, directory):
+    path = os.path.join(directory, "write_bench.properties")
+    start = time.perf_counter()
+    with AtomicPropertiesWriter(path) as writer:
+        writer.write_lines(format_entry(key, value) for key, value in entries if not key.startswith('__'))
+    seconds = time.perf_counter() - start
+    return {"seconds": seconds, "bytes": writer.bytes_written,
+            "mb_per_second": writer.bytes_written / seconds / 1e6 if seconds else None}
+
+
+def measure_translation(path, directory, languages, args):
+    rate_limit = FakeRateLimit(args.rate_limit) if args.rate_limit else None
+    translators = []
+
+    def translator_factory():
+        translator = FakeTranslator(args.latency, args.error_rate, seed=len(translators),
+                                    rate_limit=rate_limit, latency_jitter=args.latency_jitter)
+        translators.append(translator)
+        return translator
+
+    settings = {
+        "translation_memory_path": os.path.join(directory, "translation_memory.db"),
+        "requests_per_second": args.requests_per_second,
+        "max_in_flight": args.max_in_flight,
+        "retry_base_delay": 0.01,
+        "retry_max_delay": 0.5,
+        "resume_runs": False
+    }
+    combinations = [(language, os.path.join(directory, f"out_{LANGUAGES[language]}.properties"))
+                    for language in languages]
+
+    engine = LocalizationEngine(settings, translator_factory, max_workers=args.jobs)
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        summary = engine.translate_file(path, combinations)
+        seconds = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        pipeline = engine.pipeline.pipeline
+        retries, waits = pipeline.retries, pipeline.rate_limiter.waits
+        engine.close()
+
+    requests = sum(translator.calls for translator in translators)
+    return {
+        "seconds": seconds,
+        "entries": summary["entries"],
+        "entries_per_second": summary["entries"] / seconds if seconds else None,
+        "requests": requests,
+        "requests_per_second": requests / seconds if seconds else None,
+        "failed": summary["failed"],
+        "retries": retries,
+        "rate_limit_waits": waits,
+        "rate_limit_rejections": rate_limit.rejected if rate_limit else 0,
+        "cache_hits": summary["cache_hits"],
+        "cache_misses": summary["cache_misses"],
+        "peak_memory_bytes": peak
+    }
+
+
+def run_benchmark(size, languages, args):
+    directory = tempfile.mkdtemp(prefix="localizer_bench_")
+    try:
+        path = os.path.join(directory, "source.properties")
+        generate_corpus(path, size, args.seed)
+        parse_result, entries = measure_parse(path)
+        return {
+            "keys": size,
+            "languages": len(languages),
+            "source_bytes": os.path.getsize(path),
+            "parse": parse_result,
+            "write": measure_write(entries, directory),
+            "translate": measure_translation(path, directory, languages, args)
+        }
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the parse/translate/write path against a fake translator.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Corpus sizes in keys (default: 1000 10000 100000)")
+    parser.add_argument("--languages", type=int, default=6, help="Number of target languages (default: 6)")
+    parser.add_argument("--jobs", type=int, default=4, help="Concurrent translation workers (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake request latency in seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Random extra latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake requests that fail")
+    parser.add_argument("--rate-limit", type=int, default=0,
+                        help="Fake backend rejects requests above this many per second (default: off)")
+    parser.add_argument("--requests-per-second", type=float, default=0,
+                        help="Client-side rate limit passed to the pipeline (default: off)")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="Maximum concurrent requests (default: 8)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus generator seed")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    languages = [language for language in LANGUAGES if language != "English"][:max(1, args.languages)]
+
+    report = {
+        "python": sys.version.split()[0],
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": [run_benchmark(size, languages, args) for size in args.sizes]
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
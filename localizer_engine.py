@@ -0,0 +1,801 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from translation_memory import TranslationMemory
+from translation_batcher import BatchTranslator
+from translation_pipeline import TranslationPipeline, PipelineBridge
+from incremental import (compute_delta, index_entries, load_manifest, merge_output_lines,
+                         render_source_lines, save_manifest, source_hash)
+from translation_plan import SkipRules, TranslationPlan
+from translation_backends import FailoverClient, create_backends
+from batch_scheduler import JobScheduler, file_priority, is_stale
+from job_journal import JobJournal, file_fingerprint, run_fingerprint
+from placeholders import mask_placeholders, missing_tokens, placeholders_match, unmask_placeholders
+from glossary import load_glossary
+from instrumentation import Metrics, ProfileCapture
+from catalog import EXPORT_EXTENSIONS, export_properties
+from settings_store import read_settings
+from properties_io import (SPECIAL_KEYS, AtomicPropertiesWriter, iter_chunks, iter_properties,
+                           render_entry_lines)
+
+
+LANGUAGES = {
+    "English": "en",
+    "French": "fr",
+    "Spanish": "es",
+    "German": "de",
+    "Italian": "it",
+    "Portuguese": "pt",
+    "Russian": "ru",
+    "Chinese (Simplified)": "zh-cn",
+    "Japanese": "ja",
+    "Korean": "ko",
+    "Arabic": "ar",
+    "Hindi": "hi",
+    "Dutch": "nl"
+}
+
+DEFAULT_SETTINGS = {
+    "language_combinations": [
+        {"language": "English", "output_path": "english.properties", "enabled": True}
+    ]
+}
+
+
+def load_settings(settings_file):
+    settings = read_settings(settings_file)
+    if settings is None:
+        return json.loads(json.dumps(DEFAULT_SETTINGS))
+    return settings
+
+
+def get_enabled_combinations(settings):
+    return [(combo["language"], combo["output_path"])
+            for combo in settings.get("language_combinations", [])
+            if combo.get("enabled", True)]
+
+
+def parse_localization_entries(text, warning_callback=None):
+    return list(iter_properties(text.strip().split('\n'), warning_callback))
+
+
+class LocalizationEngine:
+    def __init__(self, settings, translator_factory=None, max_workers=None):
+        self.settings = settings
+        self.languages = LANGUAGES
+        self.max_workers = max_workers or settings.get("max_workers", 4)
+        self.backends = []
+        capabilities = {}
+        if translator_factory is None:
+            self.backends = create_backends(settings)
+            capabilities = self.backends[0].capabilities() if self.backends else {}
+            translator_factory = lambda: FailoverClient(self.backends)
+        self.batch_max_chars = min(settings.get("batch_max_chars", 4500),
+                                   capabilities.get("max_batch_chars", float("inf")))
+        self.batch_max_items = min(settings.get("batch_max_items", 50),
+                                   capabilities.get("max_batch_items", float("inf")))
+        self.skip_rules = SkipRules(settings.get("skip_rules"))
+        self.protect_placeholders = settings.get("protect_placeholders", True)
+        self.glossary = load_glossary(settings.get("glossary_path", "glossary.json"))
+        self.export_formats = settings.get("export_formats", [])
+        unknown = [name for name in self.export_formats if name not in EXPORT_EXTENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown export format(s): {', '.join(unknown)}. "
+                             f"Available: {', '.join(sorted(EXPORT_EXTENSIONS))}")
+        self.metrics = Metrics()
+        self.profiler = ProfileCapture(settings["profile_path"]) if settings.get("profile_path") else None
+        self.last_report = None
+        self.translation_memory = TranslationMemory(
+            settings.get("translation_memory_path", "translation_memory.db"),
+            settings.get("translation_memory_size", 10000)
+        )
+        self.pipeline = PipelineBridge(TranslationPipeline(
+            translator_factory,
+            settings.get("requests_per_second", 5.0),
+            settings.get("rate_limit_burst", 10),
+            min(settings.get("max_in_flight", 8), capabilities.get("max_concurrency", float("inf"))),
+            settings.get("max_retries", 4),
+            settings.get("retry_base_delay", 0.5),
+            settings.get("retry_max_delay", 30.0),
+            self.metrics
+        ))
+        self.placeholder_retries = 0
+        self.retry_queue = []
+        self.journal = None
+        if settings.get("resume_runs", True):
+            self.journal = JobJournal(settings.get("journal_path", "job_journal.db"))
+        self.run_id = None
+        self.resuming = False
+        self.worker_clients = threading.local()
+        self.progress_lock = threading.Lock()
+        self.progress_callback = None
+
+    def supported_languages(self):
+        if not self.backends:
+            return dict(LANGUAGES)
+        return {language: code for language, code in LANGUAGES.items()
+                if language == self.settings.get("source_language", "English")
+                or any(backend.supports(code) for backend in self.backends)}
+
+    def emit(self, event, **data):
+        if self.progress_callback:
+            payload = {"event": event}
+            payload.update(data)
+            self.progress_callback(payload)
+
+    def get_batch_translator(self):
+        batch_translator = getattr(self.worker_clients, 'batch_translator', None)
+        if batch_translator is None:
+            batch_translator = BatchTranslator(self.pipeline, self.batch_max_chars, self.batch_max_items)
+            self.worker_clients.batch_translator = batch_translator
+        return batch_translator
+
+    def translate_text(self, text, target_lang):
+        cached = self.translation_memory.get(text, target_lang, self.source_lang())
+        if cached is not None:
+            return cached
+
+        try:
+            translated = self.request_translation(text, target_lang)
+        except Exception as e:
+            raise Exception(f"Translation failed: {str(e)}")
+        if translated is None:
+            raise Exception("Translation failed: placeholders were not preserved")
+
+        self.translation_memory.put(text, target_lang, translated, self.source_lang())
+        return translated
+
+    def mask_value(self, value, target_lang):
+        if self.protect_placeholders:
+            masked, tokens = mask_placeholders(value)
+        else:
+            masked, tokens = value, []
+        if self.glossary is not None:
+            masked = self.glossary.mask(masked, target_lang, tokens)
+        return masked, tokens
+
+    def restore_value(self, value, translated, tokens):
+        if missing_tokens(translated, tokens):
+            return None
+        translated = unmask_placeholders(translated, tokens)
+        if self.protect_placeholders and not placeholders_match(value, translated):
+            return None
+        return translated
+
+    def request_translation(self, value, target_lang):
+        masked, tokens = self.mask_value(value, target_lang)
+        result = self.pipeline.translate(masked, dest=target_lang)
+        return self.restore_value(value, result.text, tokens)
+
+    def find_pending_values(self, values, target_lang):
+        with self.metrics.timer("cache_lookup"):
+            return self.lookup_pending_values(values, target_lang)
+
+    def lookup_pending_values(self, values, target_lang):
+        translations = {}
+        pending = []
+        seen = set()
+        source_lang = self.source_lang()
+
+        for value in values:
+            if value in seen:
+                continue
+            seen.add(value)
+            if self.glossary is not None:
+                resolved = self.glossary.resolve(value, target_lang)
+                if resolved is not None:
+                    translations[value] = resolved
+                    continue
+            cached = self.translation_memory.get(value, target_lang, source_lang)
+            if cached is not None:
+                translations[value] = cached
+            else:
+                pending.append(value)
+
+        return translations, pending
+
+    def cached_translation(self, value, language):
+        if self.is_source_language(language):
+            return value
+        target_lang = self.languages[language]
+        if self.glossary is not None:
+            resolved = self.glossary.resolve(value, target_lang)
+            if resolved is not None:
+                return resolved
+        if self.skip_rules.should_skip(value):
+            return value
+        return self.translation_memory.peek(value, target_lang, self.source_lang())
+
+    def translate_chunk(self, language, values, target_lang, on_progress=None):
+        reported = [0]
+
+        def report(done, total=None):
+            if on_progress and done > reported[0]:
+                on_progress(done - reported[0])
+                reported[0] = done
+
+        masks = {value: self.mask_value(value, target_lang) for value in values}
+        masked_values = list(dict.fromkeys(masked for masked, tokens in masks.values()))
+
+        try:
+            masked_results = self.get_batch_translator().translate_many(masked_values, target_lang, report)
+        except Exception as e:
+            self.emit("warning", language=language,
+                      message=f"Batch translation failed for {language}, retrying entries one by one: {str(e)}")
+            results = {}
+            for value in values:
+                try:
+                    results[value] = self.translate_text(value, target_lang)
+                except Exception as single_error:
+                    self.emit("warning", language=language,
+                              message=f"Failed to translate '{value}' for {language}: {str(single_error)}")
+                report(reported[0] + 1)
+            return results
+
+        results = {}
+        for value, (masked, tokens) in masks.items():
+            translated = self.restore_value(value, masked_results[masked], tokens)
+            if translated is None:
+                self.placeholder_retries += 1
+                try:
+                    translated = self.request_translation(value, target_lang)
+                except Exception:
+                    translated = None
+            if translated is None:
+                self.emit("warning", language=language,
+                          message=f"Placeholders were not preserved in the {language} translation of '{value}'")
+                continue
+            results[value] = translated
+
+        self.translation_memory.put_many(results, target_lang, self.source_lang())
+        report(len(values))
+        return results
+
+    def begin_run(self, run_id, resume=True):
+        if self.journal is None:
+            return
+        if not resume:
+            self.journal.finish(run_id)
+        self.run_id = run_id
+        self.resuming = self.journal.begin(run_id)
+        if self.resuming:
+            self.emit("run_resumed", run_id=run_id)
+
+    def end_run(self):
+        if self.run_id is not None:
+            self.journal.finish(self.run_id)
+        self.run_id = None
+        self.resuming = False
+
+    def record_results(self, combinations, jobs, results):
+        if self.run_id is None or not results:
+            return
+        for language, output_path in combinations:
+            job = jobs[(language, output_path)]
+            if 'keys_by_value' not in job:
+                job['keys_by_value'] = {}
+                for key, value in job['entries']:
+                    if key not in SPECIAL_KEYS and key not in job['resumed']:
+                        job['keys_by_value'].setdefault(value, []).append(key)
+            rows = [(key, value, translated) for value, translated in results.items()
+                    for key in job['keys_by_value'].get(value, ())]
+            self.journal.record_many(self.run_id, output_path, language, rows)
+
+    def mark_written(self, output_path):
+        if self.run_id is not None:
+            self.journal.mark_written(self.run_id, output_path)
+
+    def export_output(self, output_path):
+        if not self.export_formats or not os.path.exists(output_path):
+            return
+        with self.metrics.timer("export"):
+            for path in export_properties(output_path, self.export_formats):
+                self.emit("exported", output_path=output_path, path=path)
+
+    def finish_output(self, output_path):
+        self.export_output(output_path)
+        self.mark_written(output_path)
+
+    def run_chunk(self, language, values, target_lang, on_progress=None):
+        with self.metrics.timer("translate_chunk"):
+            if self.profiler is not None:
+                return self.profiler.run(self.translate_chunk, language, values, target_lang, on_progress)
+            return self.translate_chunk(language, values, target_lang, on_progress)
+
+    def render_value(self, language, output_path, job):
+        translations = job['translations']
+        resumed = job['resumed']
+
+        def translate_value(key, value):
+            if self.is_source_language(language):
+                return value
+            if key in resumed:
+                return resumed[key]
+            if value in translations:
+                return translations[value]
+            self.emit("entry_failed", language=language, output_path=output_path, key=key)
+            self.retry_queue.append((key, value, language, output_path))
+            return None
+        return translate_value
+
+    def write_combination_output(self, language, output_path, job, append=True):
+        with self.metrics.timer("write"):
+            writer = AtomicPropertiesWriter(output_path, append=append)
+            try:
+                writer.write_lines(render_entry_lines(
+                    job['entries'], self.render_value(language, output_path, job)
+                ))
+            except Exception:
+                writer.abort()
+                raise
+
+            if writer.lines_written:
+                writer.commit()
+                self.metrics.count("bytes_written", writer.bytes_written)
+            else:
+                writer.abort()
+        self.finish_output(output_path)
+
+    def read_output_entries(self, output_path):
+        if not os.path.exists(output_path):
+            return []
+        with open(output_path, 'r', encoding='utf-8') as f:
+            return list(iter_properties(f))
+
+    def write_incremental_output(self, language, output_path, entries, job):
+        delta = job['delta']
+        source_index = index_entries(entries)
+        translate_value = self.render_value(language, output_path, job)
+        updates = {}
+
+        for key in delta.keys_to_translate():
+            translated = translate_value(key, source_index[key])
+            if translated is not None:
+                updates[key] = translated
+
+        if os.path.exists(output_path):
+            lines = merge_output_lines(entries, job['output_entries'], updates, delta.removed)
+        else:
+            lines = render_source_lines(entries, updates)
+
+        with self.metrics.timer("write"), AtomicPropertiesWriter(output_path) as writer:
+            writer.write_lines(lines)
+        self.metrics.count("bytes_written", writer.bytes_written)
+
+        manifest = job['manifest']
+        for key in delta.removed:
+            manifest.pop(key, None)
+        for key in delta.unchanged:
+            manifest.setdefault(key, source_hash(source_index[key]))
+        for key in updates:
+            manifest[key] = source_hash(source_index[key])
+        save_manifest(output_path, manifest)
+        self.finish_output(output_path)
+
+    def write_job(self, language, output_path, job, append=True):
+        if job['written']:
+            return
+        if job['delta'] is not None:
+            self.write_incremental_output(language, output_path, job['entries'], job)
+        else:
+            self.write_combination_output(language, output_path, job, append)
+
+    def take_retry_jobs(self):
+        combination_entries = []
+        entries_by_combination = {}
+
+        for key, value, language, output_path in self.retry_queue:
+            combination = (language, output_path)
+            if combination not in entries_by_combination:
+                entries_by_combination[combination] = []
+                combination_entries.append((combination, entries_by_combination[combination]))
+            entries_by_combination[combination].append((key, value))
+
+        self.retry_queue = []
+        return combination_entries
+
+    def prepare_job(self, language, output_path, entries, incremental=False, remove_missing=True):
+        job = {'delta': None, 'entries': entries, 'resumed': {}, 'written': False}
+        if self.resuming and not self.is_source_language(language):
+            job['written'] = self.journal.is_written(self.run_id, output_path)
+            job['resumed'] = self.journal.lookup(self.run_id, output_path,
+                                                 [entry for entry in entries if entry[0] not in SPECIAL_KEYS])
+
+        if job['written']:
+            values = []
+        elif incremental:
+            source_index = index_entries(entries)
+            job['output_entries'] = self.read_output_entries(output_path)
+            job['manifest'] = load_manifest(output_path)
+            job['delta'] = compute_delta(source_index, index_entries(job['output_entries']),
+                                         job['manifest'], remove_missing)
+            values = [source_index[key] for key in job['delta'].keys_to_translate() if key not in job['resumed']]
+            self.emit("delta_computed", language=language, output_path=output_path, **job['delta'].counts())
+        else:
+            values = [value for key, value in entries if key not in SPECIAL_KEYS and key not in job['resumed']]
+
+        job.update({
+            'values': values,
+            'target_lang': self.languages[language],
+            'translations': {},
+            'pending': 0
+        })
+        return job
+
+    def is_source_language(self, language):
+        return language == self.settings.get("source_language", "English")
+
+    def source_lang(self):
+        source_language = self.settings.get("source_language", "English")
+        return self.languages.get(source_language, source_language)
+
+    def plan_jobs(self, jobs):
+        plan = TranslationPlan(self.skip_rules)
+        chunk_size = self.settings.get("worker_chunk_size", 0)
+
+        for combination, job in jobs.items():
+            if self.is_source_language(combination[0]):
+                continue
+            target = plan.add(combination, job['target_lang'], job['values'])
+            job['translations'] = target['translations']
+
+        cached = 0
+        for target_lang, target in plan.targets.items():
+            translations, pending = self.find_pending_values(target['values'], target_lang)
+            target['translations'].update(translations)
+            cached += len(translations)
+
+            if chunk_size > 0:
+                chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+            else:
+                chunks = [pending] if pending else []
+            target.update({'pending': len(pending), 'done': 0, 'chunks': chunks, 'chunks_left': len(chunks)})
+
+            for combination in target['combinations']:
+                jobs[combination]['pending'] = len(pending)
+
+        stats = plan.stats()
+        stats["cached"] = cached
+        self.emit("plan_ready", **stats)
+        return plan
+
+    def progress_reporter(self, target):
+        def on_progress(count):
+            with self.progress_lock:
+                target['done'] += count
+                done = target['done']
+            for language, output_path in target['combinations']:
+                self.emit("progress", language=language, output_path=output_path,
+                          done=done, total=target['pending'])
+        return on_progress
+
+    def run_jobs(self, executor, jobs, plan, on_job_done):
+        planned = set()
+        futures = {}
+        for target_lang, target in plan.targets.items():
+            planned.update(target['combinations'])
+            if not target['chunks']:
+                continue
+            language = target['combinations'][0][0]
+            on_progress = self.progress_reporter(target)
+            for chunk in target['chunks']:
+                future = executor.submit(self.run_chunk, language, chunk, target_lang, on_progress)
+                futures[future] = target
+
+        for combination, job in jobs.items():
+            if combination not in planned or not plan.targets[job['target_lang']]['chunks']:
+                on_job_done(combination, job)
+
+        for future in as_completed(futures):
+            target = futures[future]
+            results = future.result()
+            target['translations'].update(results)
+            self.record_results(target['combinations'], jobs, results)
+            target['chunks_left'] -= 1
+            if target['chunks_left'] == 0:
+                for combination in target['combinations']:
+                    on_job_done(combination, jobs[combination])
+
+    def start_run_stats(self):
+        self.translation_memory.reset_stats()
+        self.metrics.start()
+        if self.profiler is not None:
+            self.profiler.start()
+
+    def build_report(self, summary):
+        self.metrics.count("cache_hits", summary["cache_hits"])
+        self.metrics.count("cache_misses", summary["cache_misses"])
+        profile_path = self.profiler.stop() if self.profiler is not None else None
+        report = self.metrics.report(entries=summary["entries"], files=summary["files"],
+                                     failed=summary["failed"], profile_path=profile_path)
+        self.metrics.reset()
+        return report
+
+    def build_summary(self, total_entries, total_combinations):
+        summary = {
+            "entries": total_entries,
+            "files": total_combinations,
+            "failed": len(self.retry_queue),
+            "cache_hits": self.translation_memory.hits,
+            "cache_misses": self.translation_memory.misses
+        }
+        self.last_report = self.build_report(summary)
+        self.emit("report", report=self.last_report)
+        self.emit("finished", **summary)
+        return summary
+
+    def translate_and_save(self, combination_entries, progress_callback=None, incremental=None, remove_missing=True,
+                           resume=True):
+        self.progress_callback = progress_callback
+        if incremental is None:
+            incremental = self.settings.get("incremental", False)
+        total_combinations = len(combination_entries)
+        total_entries = sum(len(entries) for combination, entries in combination_entries)
+        self.start_run_stats()
+        self.begin_run(run_fingerprint(combination_entries, incremental, remove_missing), resume)
+
+        jobs = {}
+        for (language, output_path), entries in combination_entries:
+            jobs[(language, output_path)] = self.prepare_job(language, output_path, entries, incremental, remove_missing)
+
+        plan = self.plan_jobs(jobs)
+        for (language, output_path), job in jobs.items():
+            self.emit("combination_started", language=language, output_path=output_path,
+                      entries=len(job['entries']), pending=job['pending'])
+
+        completed = 0
+
+        def finish_combination(combination, job):
+            nonlocal completed
+            language, output_path = combination
+            self.write_job(language, output_path, job)
+            completed += 1
+            self.emit("combination_finished", language=language, output_path=output_path,
+                      completed=completed, total=total_combinations,
+                      cache_hits=self.translation_memory.hits, cache_misses=self.translation_memory.misses)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            self.run_jobs(executor, jobs, plan, finish_combination)
+
+        self.end_run()
+        return self.build_summary(total_entries, total_combinations)
+
+    def translate_file(self, input_path, combinations, progress_callback=None, resume=True):
+        self.progress_callback = progress_callback
+        chunk_size = max(1, self.settings.get("stream_chunk_size", 2000))
+        self.start_run_stats()
+        self.begin_run(run_fingerprint(file_fingerprint(input_path), combinations), resume)
+        writers = {}
+        total_entries = 0
+        total_combinations = len(combinations)
+        completed = 0
+
+        if self.resuming:
+            remaining = []
+            for language, output_path in combinations:
+                if self.journal.is_written(self.run_id, output_path):
+                    completed += 1
+                    self.emit("combination_finished", language=language, output_path=output_path,
+                              completed=completed, total=total_combinations, resumed=True,
+                              cache_hits=self.translation_memory.hits, cache_misses=self.translation_memory.misses)
+                else:
+                    remaining.append((language, output_path))
+            combinations = remaining
+
+        def write_chunk(combination, job):
+            language, output_path = combination
+            with self.metrics.timer("write"):
+                writers[combination].write_lines(render_entry_lines(
+                    job['entries'], self.render_value(language, output_path, job)
+                ))
+
+        try:
+            for language, output_path in combinations:
+                writers[(language, output_path)] = AtomicPropertiesWriter(output_path, append=True)
+                self.emit("combination_started", language=language, output_path=output_path)
+
+            with open(input_path, 'r', encoding='utf-8') as f, \
+                    ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                warn = lambda message: self.emit("warning", message=message)
+                for chunk in self.metrics.timed_iter("parse", iter_chunks(iter_properties(f, warn), chunk_size)):
+                    jobs = {}
+                    for language, output_path in combinations:
+                        jobs[(language, output_path)] = self.prepare_job(language, output_path, chunk)
+                    self.run_jobs(executor, jobs, self.plan_jobs(jobs), write_chunk)
+                    total_entries += len(chunk)
+                    self.emit("chunk_finished", entries=total_entries,
+                              cache_hits=self.translation_memory.hits, cache_misses=self.translation_memory.misses)
+
+            for combination in combinations:
+                writer = writers.pop(combination)
+                if writer.lines_written:
+                    with self.metrics.timer("write"):
+                        writer.commit()
+                    self.metrics.count("bytes_written", writer.bytes_written)
+                else:
+                    writer.abort()
+                self.finish_output(combination[1])
+                completed += 1
+                self.emit("combination_finished", language=combination[0], output_path=combination[1],
+                          completed=completed, total=total_combinations,
+                          cache_hits=self.translation_memory.hits, cache_misses=self.translation_memory.misses)
+        finally:
+            for writer in writers.values():
+                writer.abort()
+
+        self.end_run()
+        return self.build_summary(total_entries * len(combinations), total_combinations)
+
+    def translate_batch(self, sources, progress_callback=None, incremental=None, priority=None, resume=True):
+        self.progress_callback = progress_callback
+        if incremental is None:
+            incremental = self.settings.get("incremental", False)
+        policy = priority or self.settings.get("batch_priority", "changed_first")
+        chunk_size = max(1, self.settings.get("worker_chunk_size", 0) or self.batch_max_items * 4)
+        self.start_run_stats()
+        self.begin_run(run_fingerprint([(path, file_fingerprint(path), combinations) for path, combinations in sources],
+                                       incremental), resume)
+
+        files = []
+        for index, (source_path, combinations) in enumerate(sources):
+            warn = lambda message, path=source_path: self.emit("warning", path=path, message=message)
+            with self.metrics.timer("parse"), open(source_path, 'r', encoding='utf-8') as f:
+                entries = list(iter_properties(f, warn))
+            jobs = {}
+            for language, output_path in combinations:
+                jobs[(language, output_path)] = self.prepare_job(language, output_path, entries, incremental)
+            if incremental:
+                changed = any(job['values'] for job in jobs.values())
+            else:
+                changed = any(is_stale(source_path, output_path) for language, output_path in combinations)
+            files.append((file_priority(policy, index, os.path.getsize(source_path), changed), source_path, jobs))
+        files.sort(key=lambda item: item[0])
+
+        plan = TranslationPlan(self.skip_rules)
+        owners = {}
+        units = []
+        waiting = {}
+        jobs = {}
+        cached = 0
+
+        for file_rank, source_path, file_jobs in files:
+            for combination, job in file_jobs.items():
+                jobs[combination] = job
+                if self.is_source_language(combination[0]):
+                    waiting[combination] = set()
+                    continue
+
+                target_lang = job['target_lang']
+                target = plan.target(target_lang)
+                known = len(target['values'])
+                plan.add(combination, target_lang, job['values'])
+                job['translations'] = target['translations']
+
+                translations, pending = self.find_pending_values(target['values'][known:], target_lang)
+                target['translations'].update(translations)
+                cached += len(translations)
+                for start in range(0, len(pending), chunk_size):
+                    unit = len(units)
+                    chunk = pending[start:start + chunk_size]
+                    units.append({'index': unit, 'rank': file_rank, 'language': combination[0], 'target_lang': target_lang,
+                                  'values': chunk, 'dependents': []})
+                    for value in chunk:
+                        owners[(target_lang, value)] = unit
+
+                waiting[combination] = {owners[(target_lang, value)] for value in job['values']
+                                        if (target_lang, value) in owners}
+                job['pending'] = sum(len(units[unit]['values']) for unit in waiting[combination])
+                for unit in waiting[combination]:
+                    units[unit]['dependents'].append(combination)
+
+        stats = plan.stats()
+        stats["cached"] = cached
+        self.emit("plan_ready", **stats)
+        total_pending = sum(len(unit['values']) for unit in units)
+        self.emit("batch_planned", files=len(files), combinations=len(jobs), units=len(units),
+                  pending=total_pending, priority=policy)
+
+        for language, output_path in jobs:
+            self.emit("combination_started", language=language, output_path=output_path,
+                      entries=len(jobs[(language, output_path)]['entries']),
+                      pending=jobs[(language, output_path)]['pending'])
+
+        completed = 0
+        done = [0]
+
+        def on_progress(count):
+            with self.progress_lock:
+                done[0] += count
+                current = done[0]
+            self.emit("progress", done=current, total=total_pending)
+
+        def finish_combination(combination):
+            nonlocal completed
+            language, output_path = combination
+            job = jobs[combination]
+            self.write_job(language, output_path, job, append=False)
+            completed += 1
+            self.emit("combination_finished", language=language, output_path=output_path,
+                      completed=completed, total=len(jobs),
+                      cache_hits=self.translation_memory.hits, cache_misses=self.translation_memory.misses)
+
+        def unit_done(unit):
+            def on_done(results):
+                plan.targets[unit['target_lang']]['translations'].update(results)
+                self.record_results(unit['dependents'], jobs, results)
+                for combination in unit['dependents']:
+                    waiting[combination].discard(unit['index'])
+                    if not waiting[combination]:
+                        finish_combination(combination)
+            return on_done
+
+        for combination in jobs:
+            if not waiting[combination]:
+                finish_combination(combination)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            scheduler = JobScheduler(executor, self.max_workers * 2)
+            for unit in units:
+                scheduler.add(unit['rank'], unit_done(unit), self.run_chunk,
+                              unit['language'], unit['values'], unit['target_lang'], on_progress)
+            scheduler.run()
+
+        self.end_run()
+        total_entries = sum(len(job['entries']) for job in jobs.values())
+        return self.build_summary(total_entries, len(jobs))
+
+    def replace_undecodable_bytes(self, output_path):
+        with open(output_path, 'rb') as f:
+            data = f.read()
+        try:
+            data.decode('utf-8')
+            return
+        except UnicodeDecodeError:
+            pass
+        with AtomicPropertiesWriter(output_path) as writer:
+            writer.write_lines(data.decode('utf-8', errors='replace').splitlines())
+
+    def repair_outputs(self, results, progress_callback=None):
+        sources = {}
+        combination_entries = []
+
+        for result in results:
+            if not result["retranslate"] and not result["issues"]["duplicate"]:
+                continue
+            source_path = result["source_path"]
+            language = result["language"]
+            output_path = result["output_path"]
+            if source_path not in sources:
+                with open(source_path, 'r', encoding='utf-8') as f:
+                    sources[source_path] = list(iter_properties(f))
+            entries = sources[source_path]
+
+            if result["issues"]["encoding"]:
+                self.replace_undecodable_bytes(output_path)
+            missing = set(result["issues"]["missing"])
+            stale = [key for key in result["retranslate"] if key not in missing]
+            if stale:
+                # Forget the bad translations and mark the keys as changed so the
+                # incremental write translates them again in place.
+                source_index = index_entries(entries)
+                if not self.is_source_language(language):
+                    self.translation_memory.discard_many([source_index[key] for key in stale],
+                                                         self.languages[language], self.source_lang())
+                manifest = load_manifest(output_path)
+                for key in stale:
+                    manifest[key] = ""
+                save_manifest(output_path, manifest)
+            combination_entries.append(((language, output_path), entries))
+
+        if not combination_entries:
+            return None
+        return self.translate_and_save(combination_entries, progress_callback, incremental=True,
+                                       remove_missing=False, resume=False)
+
+    def close(self):
+        self.pipeline.close()
+        if self.journal is not None:
+            self.journal.close()
+        self.translation_memory.close()
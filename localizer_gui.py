@@ -1,64 +1,96 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import re
 import os
-from googletrans import Translator
 import threading
-import json
+import queue
+import time
+from localizer_engine import DEFAULT_SETTINGS, LocalizationEngine, parse_localization_entries
+from properties_io import iter_properties
+from key_index import KeyIndex
+from instrumentation import format_report, save_report
+from settings_store import SettingsStore
 
 
 class LocalizerGUI:
+    PROGRESS_REFRESH_MS = 100
+    SETTINGS_SAVE_DELAY_MS = 500
+    SETTINGS_POLL_MS = 1000
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Localization Text Manager")
         self.root.geometry("800x600")
         self.root.minsize(600, 500)
         
-        self.translator = Translator()
+        self.progress_events = queue.Queue()
+        self.combination_progress = {}
+        self.run_started = 0
+        self.run_active = False
+        self.source_entries = None
         self.settings_file = "localizer_settings.json"
-        self.settings = self.load_settings()
+        self.settings_store = SettingsStore(self.settings_file, DEFAULT_SETTINGS,
+                                            self.SETTINGS_SAVE_DELAY_MS / 1000)
+        self.settings = self.settings_store.settings
+        self.engine, engine_error = self.create_engine()
         self.combination_frames = []
-        
-        self.languages = {
-            "English": "en",
-            "French": "fr",
-            "Spanish": "es", 
-            "German": "de",
-            "Italian": "it",
-            "Portuguese": "pt",
-            "Russian": "ru",
-            "Chinese (Simplified)": "zh-cn",
-            "Japanese": "ja",
-            "Korean": "ko",
-            "Arabic": "ar",
-            "Hindi": "hi",
-            "Dutch": "nl"
-        }
+        self.languages = self.engine.supported_languages()
         
         self.setup_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        if self.settings_store.load_error:
+            messagebox.showerror("Settings Error", f"{self.settings_store.load_error}\n\n"
+                                 f"Default settings are in use. The original file was copied to {self.settings_file}.corrupt.")
+        elif engine_error:
+            messagebox.showerror("Settings Error", f"{engine_error}\n\n"
+                                 f"Translating with the default backend, without a glossary or exports, "
+                                 f"until {self.settings_file} is fixed.")
+        self.root.after(self.SETTINGS_POLL_MS, self.poll_settings)
     
-    def load_settings(self):
-        default_settings = {
-            "language_combinations": [
-                {"language": "English", "output_path": "english.properties", "enabled": True}
-            ]
-        }
-        
+    def create_engine(self):
         try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        
-        return default_settings
+            return LocalizationEngine(self.settings), None
+        except Exception as e:
+            engine = LocalizationEngine(dict(self.settings, translation_backends=["googletrans"], export_formats=[],
+                                             glossary_path=None))
+            engine.settings = self.settings
+            return engine, str(e)
     
     def save_settings(self):
+        self.settings_store.schedule_save()
+    
+    def poll_settings(self):
+        error = self.settings_store.take_save_error()
+        if error:
+            self.update_status(f"Failed to save settings: {error}", "red")
+        try:
+            if not self.run_active:
+                self.reload_settings()
+        finally:
+            self.root.after(self.SETTINGS_POLL_MS, self.poll_settings)
+    
+    def reload_settings(self):
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2, ensure_ascii=False)
+            settings = self.settings_store.check_for_changes()
+            if settings is None:
+                return
+            engine = LocalizationEngine(settings)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
+            self.update_status(f"Settings file was not reloaded: {str(e)}", "red")
+            return
+        
+        self.engine.close()
+        engine.settings = self.settings_store.replace(settings)
+        self.engine = engine
+        self.languages = engine.supported_languages()
+        self.incremental_var.set(self.settings.get("incremental", False))
+        self.refresh_combinations_display()
+        self.retry_btn.config(text="Retry Failed", state="disabled")
+        self.report_btn.config(state="disabled")
+        self.update_status("Settings reloaded from disk", "green")
+    
+    def on_close(self):
+        self.settings_store.close()
+        self.root.destroy()
     
     def get_language_combinations(self):
         return self.settings.get("language_combinations", [])
@@ -91,6 +123,15 @@ class LocalizerGUI:
             combinations[index]["enabled"] = enabled
             self.settings["language_combinations"] = combinations
             self.save_settings()
+            self.key_table.set_languages(self.table_languages())
+    
+    def table_languages(self):
+        return list(dict.fromkeys(combo["language"] for combo in self.get_language_combinations()
+                                  if combo.get("enabled", True)))
+    
+    def update_incremental(self):
+        self.settings["incremental"] = self.incremental_var.get()
+        self.save_settings()
     
     def setup_gui(self):
         main_frame = ttk.Frame(self.root, padding="10")
@@ -108,19 +149,35 @@ class LocalizerGUI:
             row=0, column=0, sticky=tk.W
         )
         
+        ttk.Button(header_frame, text="📂 Open File", command=self.open_source_file).grid(
+            row=0, column=1, sticky=tk.E, padx=(0, 5)
+        )
+        
         ttk.Button(header_frame, text="⚙️ Settings", command=self.open_settings).grid(
-            row=0, column=1, sticky=tk.E
+            row=0, column=2, sticky=tk.E
         )
         
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+        main_frame.rowconfigure(1, weight=1)
+        
+        editor_frame = ttk.Frame(self.notebook)
+        editor_frame.columnconfigure(0, weight=1)
+        editor_frame.rowconfigure(0, weight=1)
+        
         self.text_area = scrolledtext.ScrolledText(
-            main_frame, 
+            editor_frame, 
             height=15, 
             width=70,
             font=("Consolas", 10),
             wrap=tk.WORD
         )
-        self.text_area.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
-        main_frame.rowconfigure(1, weight=1)
+        self.text_area.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.key_table = KeyTable(self.notebook, self)
+        self.notebook.add(editor_frame, text="Editor")
+        self.notebook.add(self.key_table.frame, text="Keys")
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         self.combinations_frame = ttk.LabelFrame(main_frame, text="Selected Language Outputs", padding="10")
         self.combinations_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
@@ -143,15 +200,29 @@ class LocalizerGUI:
         )
         self.translate_btn.pack(side=tk.LEFT, padx=(0, 10))
         
-        ttk.Button(button_frame, text="Clear Text", command=self.clear_text).pack(side=tk.LEFT)
+        self.retry_btn = ttk.Button(button_frame, text="Retry Failed", command=self.start_retry, state="disabled")
+        self.retry_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.report_btn = ttk.Button(button_frame, text="Report", command=self.open_report, state="disabled")
+        self.report_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        ttk.Button(button_frame, text="Clear Text", command=self.clear_text).pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.incremental_var = tk.BooleanVar(value=self.settings.get("incremental", False))
+        ttk.Checkbutton(button_frame, text="Only new/changed keys", variable=self.incremental_var,
+                        command=self.update_incremental).pack(side=tk.LEFT)
         
         self.status_label = ttk.Label(main_frame, text="Ready", foreground="green")
         self.status_label.grid(row=4, column=0, sticky=tk.W)
         
-        self.progress = ttk.Progressbar(main_frame, mode='indeterminate')
+        self.progress = ttk.Progressbar(main_frame, mode='determinate')
         self.progress.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
         self.progress.grid_remove()
         
+        self.progress_label = ttk.Label(main_frame, text="", foreground="gray", font=("Arial", 9))
+        self.progress_label.grid(row=6, column=0, sticky=tk.W)
+        self.progress_label.grid_remove()
+        
         self.load_sample_text()
         
     def load_sample_text(self):
@@ -170,6 +241,55 @@ error.invalid=Invalid input provided"""
     def open_settings(self):
         SettingsWindow(self.root, self)
         
+    def open_report(self):
+        if self.engine.last_report is not None:
+            ReportWindow(self.root, self.engine.last_report)
+        
+    def open_source_file(self):
+        filename = filedialog.askopenfilename(
+            title="Open Localization File",
+            filetypes=[
+                ("Properties files", "*.properties"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filename:
+            return
+            
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                entries = list(iter_properties(f))
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open file: {str(e)}")
+            return
+            
+        self.source_entries = entries
+        self.key_table.load(entries)
+        self.text_area.config(state="normal")
+        self.text_area.delete(1.0, tk.END)
+        self.text_area.insert(tk.END, f"# {filename} is loaded ({len(self.key_table.index)} keys).\n"
+                                      f"# Browse it in the Keys tab, or click Clear Text to type keys here instead.")
+        self.text_area.config(state="disabled")
+        self.text_area.edit_modified(False)
+        self.notebook.select(self.key_table.frame)
+        self.update_status(f"Loaded {len(self.key_table.index)} keys from {os.path.basename(filename)}", "green")
+        
+    def on_tab_changed(self, event=None):
+        if self.notebook.select() != str(self.key_table.frame):
+            return
+        if self.source_entries is None and self.text_area.edit_modified():
+            self.key_table.load(parse_localization_entries(self.text_area.get(1.0, tk.END)))
+            self.text_area.edit_modified(False)
+        else:
+            self.key_table.render()
+        
+    def update_combination_widget(self, frame_data, combo_data):
+        frame_data['checkbox_var'].set(combo_data.get("enabled", True))
+        frame_data['status_label'].config(text="●", foreground="green")
+        frame_data['text_label'].config(text=f"{combo_data['language']} → {os.path.basename(combo_data['output_path'])}")
+        frame_data['language'] = combo_data["language"]
+        frame_data['output_path'] = combo_data["output_path"]
+        
     def create_combination_widget(self, combo_data, index):
         language = combo_data["language"]
         output_path = combo_data["output_path"]
@@ -203,21 +323,22 @@ error.invalid=Invalid input provided"""
         return frame_data
     
     def refresh_combinations_display(self):
-        for frame_data in self.combination_frames:
-            frame_data['frame'].destroy()
-        
-        self.combination_frames = []
         combinations = self.get_language_combinations()
+        while len(self.combination_frames) > len(combinations):
+            self.combination_frames.pop()['frame'].destroy()
         
         if not combinations:
             self.combinations_info.grid(row=0, column=0, pady=10)
         else:
             self.combinations_info.grid_remove()
             for i, combo_data in enumerate(combinations):
-                frame_data = self.create_combination_widget(combo_data, i)
-                self.combination_frames.append(frame_data)
+                if i < len(self.combination_frames):
+                    self.update_combination_widget(self.combination_frames[i], combo_data)
+                else:
+                    self.combination_frames.append(self.create_combination_widget(combo_data, i))
         
         self.combinations_frame.columnconfigure(0, weight=1)
+        self.key_table.set_languages(self.table_languages())
     
     
     
@@ -232,28 +353,60 @@ error.invalid=Invalid input provided"""
     
             
     def clear_text(self):
+        self.source_entries = None
+        self.text_area.config(state="normal")
         self.text_area.delete(1.0, tk.END)
+        self.key_table.load([])
         
     def update_status(self, message, color="black"):
         self.status_label.config(text=message, foreground=color)
-        self.root.update()
+        
+    def post_event(self, event):
+        self.progress_events.put(event)
         
     def start_translation(self):
         if not self.validate_inputs():
             return
             
+        selected_combinations = self.get_selected_combinations()
+        if self.source_entries is not None:
+            entries = self.source_entries
+            self.run_in_background(lambda: self.run_engine([(combination, entries) for combination in selected_combinations]))
+            return
+            
+        text_content = self.text_area.get(1.0, tk.END)
+        self.run_in_background(lambda: self.translate_and_save(text_content, selected_combinations))
+        
+    def start_retry(self):
+        if not self.engine.retry_queue:
+            return
+            
+        self.run_in_background(self.retry_failed)
+        
+    def run_in_background(self, target):
+        self.run_active = True
         self.translate_btn.config(state="disabled")
+        self.retry_btn.config(state="disabled")
+        self.combination_progress = {}
+        self.key_table.index.clear_failed()
+        self.run_started = time.monotonic()
+        self.progress.config(value=0, maximum=1)
         self.progress.grid()
-        self.progress.start(10)
+        self.progress_label.config(text="")
+        self.progress_label.grid()
         self.update_status("Translating...", "blue")
         
-        thread = threading.Thread(target=self.translate_and_save)
+        thread = threading.Thread(target=target)
         thread.daemon = True
         thread.start()
+        self.root.after(self.PROGRESS_REFRESH_MS, self.poll_progress)
         
     def validate_inputs(self):
-        text_content = self.text_area.get(1.0, tk.END).strip()
-        if not text_content:
+        if self.source_entries is not None:
+            if not self.source_entries:
+                messagebox.showerror("Error", "The opened file has no localization keys to translate.")
+                return False
+        elif not self.text_area.get(1.0, tk.END).strip():
             messagebox.showerror("Error", "Please enter localization keys to translate.")
             return False
             
@@ -265,106 +418,296 @@ error.invalid=Invalid input provided"""
         return True
         
     def parse_localization_entries(self, text):
-        entries = []
-        lines = text.strip().split('\n')
-        
-        for line_num, line in enumerate(lines, 1):
-            original_line = line
-            line = line.strip()
+        with self.engine.metrics.timer("parse"):
+            return parse_localization_entries(
+                text, lambda message: self.post_event({"event": "warning", "message": message})
+            )
+        
+    def set_combination_status(self, language, output_path, text, color):
+        frame_data = next((fd for fd in self.combination_frames if fd['language'] == language and fd['output_path'] == output_path), None)
+        if frame_data:
+            frame_data['status_label'].config(text=text, foreground=color)
             
-            if not line:
-                entries.append(('__EMPTY_LINE__', ''))
-                continue
-            elif line.startswith('#'):
-                entries.append(('__COMMENT__', original_line))
-                continue
+    def poll_progress(self):
+        status = None
+        indicators = {}
+        finished_event = None
+        table_changed = False
+        
+        while True:
+            try:
+                event = self.progress_events.get_nowait()
+            except queue.Empty:
+                break
+                
+            kind = event["event"]
+            combination = (event.get("language"), event.get("output_path"))
+            if kind == "combination_started":
+                indicators[combination] = ("⏳", "orange")
+                self.combination_progress[combination] = [0, event["pending"]]
+            elif kind == "progress":
+                self.combination_progress[combination] = [event["done"], event["total"]]
+            elif kind == "combination_finished":
+                indicators[combination] = ("✓", "green")
+                if combination in self.combination_progress:
+                    self.combination_progress[combination][0] = self.combination_progress[combination][1]
+                status = (f"Finished {event['language']} ({event['completed']}/{event['total']}) - {self.engine.translation_memory.stats_text()}", "blue")
+                table_changed = True
+            elif kind == "run_resumed":
+                status = ("Resuming an interrupted run - already translated keys are skipped", "blue")
+            elif kind == "plan_ready":
+                status = (f"Planned {event['unique']} unique translations ({event['duplicates']} duplicates, {event['skipped']} skipped, {event['cached']} cached)", "blue")
+            elif kind == "delta_computed":
+                status = (f"{event['language']}: {event['added']} new, {event['changed']} changed, {event['removed']} removed keys", "blue")
+            elif kind == "warning":
+                status = (event["message"], "orange")
+            elif kind == "entry_failed":
+                status = (f"Failed to translate '{event['key']}' for {event['language']}, queued for retry", "red")
+                self.key_table.index.mark_failed(event['key'], event['language'])
+                table_changed = True
+            elif kind in ("run_finished", "run_failed"):
+                finished_event = event
                 
-            match = re.match(r'^([^=]+)=(.*)$', line)
-            if match:
-                key = match.group(1).strip()
-                value = match.group(2).strip()
-                entries.append((key, value))
+        for (language, output_path), (text, color) in indicators.items():
+            self.set_combination_status(language, output_path, text, color)
+        if status:
+            self.update_status(*status)
+        if table_changed:
+            self.key_table.render()
+        self.draw_progress()
+        
+        if finished_event:
+            self.finish_run(finished_event)
+        else:
+            self.root.after(self.PROGRESS_REFRESH_MS, self.poll_progress)
+            
+    def draw_progress(self):
+        done = sum(progress[0] for progress in self.combination_progress.values())
+        total = sum(progress[1] for progress in self.combination_progress.values())
+        elapsed = time.monotonic() - self.run_started
+        rate = done / elapsed if elapsed > 0 else 0
+        
+        self.progress.config(value=done, maximum=max(total, 1))
+        if not total:
+            return
+        text = f"{done}/{total} entries translated · {rate:.1f} entries/s"
+        if 0 < rate and done < total:
+            remaining = int((total - done) / rate)
+            text += f" · ETA {remaining // 60}:{remaining % 60:02d}"
+        self.progress_label.config(text=text)
+        
+    def finish_run(self, event):
+        if event["event"] == "run_failed":
+            self.update_status(f"Error: {event['message']}", "red")
+            if event.get("show_dialog", True):
+                messagebox.showerror("Error", f"An error occurred:\n{event['message']}")
+        else:
+            summary = event["summary"]
+            stats = self.engine.translation_memory.stats_text()
+            if summary["failed"]:
+                self.update_status(f"Translated {summary['entries']} entries across {summary['files']} files, {summary['failed']} failed and were queued for retry ({stats})", "orange")
+                messagebox.showwarning("Partially Completed", f"Translation completed with errors.\n{summary['failed']} entries could not be translated and were not written.\nClick \"Retry Failed\" to translate them again.")
             else:
-                self.update_status(f"Warning: Invalid format on line {line_num}: {line}", "orange")
+                self.update_status(f"Successfully translated and saved {summary['entries']} entries across {summary['files']} files! ({stats})", "green")
+                messagebox.showinfo("Success", f"Translation completed!\n{summary['entries']} entries saved across {summary['files']} files.")
+                
+        retry_count = len(self.engine.retry_queue)
+        self.run_active = False
+        self.progress.grid_remove()
+        self.progress_label.grid_remove()
+        self.translate_btn.config(state="normal")
+        self.retry_btn.config(text=f"Retry Failed ({retry_count})" if retry_count else "Retry Failed",
+                              state="normal" if retry_count else "disabled")
+        self.report_btn.config(state="normal" if self.engine.last_report is not None else "disabled")
+        for frame_data in self.combination_frames:
+            if frame_data['status_label'].cget('text') == '⏳':
+                frame_data['status_label'].config(text="●", foreground="green")
+        self.key_table.render()
                 
-        return entries
+    def retry_failed(self):
+        self.run_engine(self.engine.take_retry_jobs(), remove_missing=False)
         
-    def translate_text(self, text, target_lang):
-        try:
-            result = self.translator.translate(text, dest=target_lang)
-            return result.text
-        except Exception as e:
-            raise Exception(f"Translation failed: {str(e)}")
-            
-    def translate_and_save(self):
+    def translate_and_save(self, text_content, selected_combinations):
         try:
-            text_content = self.text_area.get(1.0, tk.END)
             entries = self.parse_localization_entries(text_content)
+        except Exception as e:
+            self.post_event({"event": "run_failed", "message": str(e)})
+            return
             
-            if not entries:
-                self.update_status("No valid entries found to translate", "red")
-                return
-                
-            selected_combinations = self.get_selected_combinations()
-            total_combinations = len(selected_combinations)
-            total_entries = len(entries)
+        if not entries:
+            self.post_event({"event": "run_failed", "message": "No valid entries found to translate", "show_dialog": False})
+            return
             
-            for combo_idx, (language, output_path) in enumerate(selected_combinations, 1):
-                frame_data = next((fd for fd in self.combination_frames if fd['language'] == language and fd['output_path'] == output_path), None)
-                if frame_data:
-                    frame_data['status_label'].config(text="⏳", foreground="orange")
-                target_lang_code = self.languages[language]
-                translated_entries = []
-                
-                self.update_status(f"Processing {language} ({combo_idx}/{total_combinations})...", "blue")
-                
-                for i, (key, value) in enumerate(entries, 1):
-                    try:
-                        if key == '__COMMENT__':
-                            translated_entries.append(value)
-                        elif key == '__EMPTY_LINE__':
-                            translated_entries.append('')
-                        else:
-                            if language == "English":
-                                translated_value = value
-                            else:
-                                translated_value = self.translate_text(value, target_lang_code)
-                            translated_entries.append(f"{key}={translated_value}")
-                            self.update_status(f"Processing {language}... ({i}/{total_entries})", "blue")
-                    except Exception as e:
-                        self.update_status(f"Failed to translate '{key}' for {language}: {str(e)}", "red")
-                        if key not in ['__COMMENT__', '__EMPTY_LINE__']:
-                            translated_entries.append(f"{key}={value}")
-                        
-                output_content = '\n'.join(translated_entries) + '\n'
-                
-                os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-                
-                file_exists = os.path.exists(output_path)
-                mode = 'a' if file_exists else 'w'
+        self.run_engine([(combination, entries) for combination in selected_combinations])
+        
+    def run_engine(self, combination_entries, remove_missing=True):
+        try:
+            summary = self.engine.translate_and_save(combination_entries, self.post_event,
+                                                     remove_missing=remove_missing)
+            self.post_event({"event": "run_finished", "summary": summary})
+        except Exception as e:
+            self.post_event({"event": "run_failed", "message": str(e)})
+
+
+class KeyTable:
+    PAGE_ROWS = 18
+    SEARCH_DELAY_MS = 150
+    
+    def __init__(self, parent, main_app):
+        self.main_app = main_app
+        self.index = KeyIndex()
+        self.rows = []
+        self.offset = 0
+        self.languages = []
+        self.search_job = None
+        
+        self.frame = ttk.Frame(parent, padding="5")
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+        
+        filter_frame = ttk.Frame(self.frame)
+        filter_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5))
+        filter_frame.columnconfigure(1, weight=1)
+        
+        ttk.Label(filter_frame, text="Search:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self.schedule_filter())
+        ttk.Entry(filter_frame, textvariable=self.search_var).grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
+        
+        self.failed_only_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(filter_frame, text="Failed only", variable=self.failed_only_var,
+                        command=self.apply_filter).grid(row=0, column=2, padx=(0, 10))
+        
+        self.count_label = ttk.Label(filter_frame, text="", foreground="gray", font=("Arial", 9))
+        self.count_label.grid(row=0, column=3, sticky=tk.E)
+        
+        self.tree = ttk.Treeview(self.frame, show="headings", height=self.PAGE_ROWS, selectmode="browse")
+        self.tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.scroll)
+        self.scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        
+        self.tree.bind("<MouseWheel>", lambda event: self.scroll("scroll", -1 if event.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda event: self.scroll("scroll", -1, "units"))
+        self.tree.bind("<Button-5>", lambda event: self.scroll("scroll", 1, "units"))
+        self.tree.bind("<Prior>", lambda event: self.scroll("scroll", -1, "pages"))
+        self.tree.bind("<Next>", lambda event: self.scroll("scroll", 1, "pages"))
+        
+        for slot in range(self.PAGE_ROWS):
+            self.tree.insert("", tk.END, iid=str(slot))
+        self.set_languages([])
+        
+    def set_languages(self, languages):
+        self.languages = list(languages)
+        columns = ["key", "value"] + [f"lang{i}" for i in range(len(self.languages))]
+        self.tree.configure(columns=columns, displaycolumns=columns)
+        self.tree.heading("key", text="Key")
+        self.tree.heading("value", text="Source")
+        self.tree.column("key", width=180, stretch=False)
+        self.tree.column("value", width=220)
+        for i, language in enumerate(self.languages):
+            self.tree.heading(f"lang{i}", text=language)
+            self.tree.column(f"lang{i}", width=160)
+        self.render()
+        
+    def load(self, entries):
+        self.index.load(entries)
+        self.apply_filter()
+        
+    def schedule_filter(self):
+        if self.search_job is not None:
+            self.frame.after_cancel(self.search_job)
+        self.search_job = self.frame.after(self.SEARCH_DELAY_MS, self.apply_filter)
+        
+    def apply_filter(self):
+        self.search_job = None
+        self.rows = self.index.filter(self.search_var.get(), self.failed_only_var.get())
+        self.offset = 0
+        self.count_label.config(text=f"{len(self.rows)} of {len(self.index)} keys")
+        self.render()
+        
+    def scroll(self, action, amount=0, unit="units"):
+        if action == "moveto":
+            self.offset = int(float(amount) * len(self.rows))
+        else:
+            self.offset += int(amount) * (self.PAGE_ROWS if unit == "pages" else 1)
+        self.render()
+        return "break"
+        
+    def row_values(self, position):
+        key, value = self.index.row(position)
+        values = [key, value]
+        for language in self.languages:
+            if self.index.is_failed(key, language):
+                values.append("✗ failed")
+                continue
+            translated = self.main_app.engine.cached_translation(value, language)
+            values.append(translated if translated is not None else "…")
+        return values
+        
+    def render(self):
+        self.offset = min(max(self.offset, 0), max(0, len(self.rows) - self.PAGE_ROWS))
+        for slot in range(self.PAGE_ROWS):
+            position = self.offset + slot
+            if position < len(self.rows):
+                self.tree.move(str(slot), "", slot)
+                self.tree.item(str(slot), values=self.row_values(self.rows[position]))
+            else:
+                self.tree.detach(str(slot))
                 
-                with open(output_path, mode, encoding='utf-8') as f:
-                    if file_exists:
-                        f.write('\n')
-                    f.write(output_content)
-                    
-                if frame_data:
-                    frame_data['status_label'].config(text="✓", foreground="green")
-                    
-            self.update_status(f"Successfully translated and saved {len(entries)} entries to {total_combinations} files!", "green")
-            messagebox.showinfo("Success", f"Translation completed!\n{len(entries)} entries saved to {total_combinations} files.")
+        if self.rows:
+            self.scrollbar.set(self.offset / len(self.rows), min(1.0, (self.offset + self.PAGE_ROWS) / len(self.rows)))
+        else:
+            self.scrollbar.set(0, 1)
+
+
+class ReportWindow:
+    def __init__(self, parent, report):
+        self.report = report
+        self.window = tk.Toplevel(parent)
+        self.window.title("Performance Report")
+        self.window.geometry("760x500")
+        self.window.transient(parent)
+        
+        self.setup_ui()
+        
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.window, padding="15")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.window.columnconfigure(0, weight=1)
+        self.window.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+        
+        text_area = scrolledtext.ScrolledText(main_frame, font=("Consolas", 9), wrap=tk.NONE)
+        text_area.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 15))
+        text_area.insert(tk.END, format_report(self.report))
+        text_area.config(state="disabled")
+        
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
+        
+        ttk.Button(buttons_frame, text="Export JSON", command=self.export_json).pack(side=tk.LEFT)
+        ttk.Button(buttons_frame, text="Close", command=self.window.destroy).pack(side=tk.RIGHT)
+        
+    def export_json(self):
+        filename = filedialog.asksaveasfilename(
+            title="Export Report",
+            defaultextension=".json",
+            filetypes=[
+                ("JSON files", "*.json"),
+                ("All files", "*.*")
+            ]
+        )
+        if not filename:
+            return
             
+        try:
+            save_report(self.report, filename)
         except Exception as e:
-            self.update_status(f"Error: {str(e)}", "red")
-            messagebox.showerror("Error", f"An error occurred:\n{str(e)}")
-            
-        finally:
-            self.progress.stop()
-            self.progress.grid_remove()
-            self.translate_btn.config(state="normal")
-            for frame_data in self.combination_frames:
-                if frame_data['status_label'].cget('text') == '⏳':
-                    frame_data['status_label'].config(text="●", foreground="green")
+            messagebox.showerror("Error", f"Failed to export report: {str(e)}")
+            return
+        messagebox.showinfo("Success", "Report exported successfully!")
 
 
 class SettingsWindow:
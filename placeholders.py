@@ -0,0 +1,61 @@
+import re
+from collections import Counter
+
+PLACEHOLDER_PATTERN = (r'\{\{[^}]*\}\}|\$\{[^}]*\}|\{[^}]*\}'
+                       r'|%(?:\d+\$)?[-+0#]*\d*(?:\.\d+)?[sdifuxXeEgGcp%@](?![A-Za-z])'
+                       r'|</?[A-Za-z][^<>]*>|&\w+;')
+TOKEN_FORMAT = "__PH{}__"
+
+_PLACEHOLDER = re.compile(PLACEHOLDER_PATTERN)
+_TOKEN = re.compile(r'_\s*_\s*PH\s*(\d+)\s*_\s*_', re.IGNORECASE)
+
+
+def find_placeholders(text):
+    return _PLACEHOLDER.findall(text)
+
+
+def mask_placeholders(text):
+    tokens = []
+
+    def replace(match):
+        tokens.append(match.group(0))
+        return TOKEN_FORMAT.format(len(tokens) - 1)
+
+    masked = _PLACEHOLDER.sub(replace, text)
+    return masked, tokens
+
+
+def mask_with_tokens(text, tokens):
+    indexes = {}
+    for index, token in enumerate(tokens):
+        indexes.setdefault(token, []).append(index)
+
+    def replace(match):
+        available = indexes.get(match.group(0))
+        return TOKEN_FORMAT.format(available.pop(0)) if available else match.group(0)
+
+    return _PLACEHOLDER.sub(replace, text)
+
+
+def unmask_placeholders(text, tokens):
+    if not tokens:
+        return text
+
+    def replace(match):
+        index = int(match.group(1))
+        return tokens[index] if index < len(tokens) else match.group(0)
+
+    return _TOKEN.sub(replace, text)
+
+
+def placeholders_match(source, translated):
+    return Counter(find_placeholders(source)) == Counter(find_placeholders(translated))
+
+
+def strip_tokens(text):
+    return _TOKEN.sub('', text)
+
+
+def missing_tokens(text, tokens):
+    found = {int(index) for index in _TOKEN.findall(text)}
+    return [index for index in range(len(tokens)) if index not in found]
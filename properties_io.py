@@ -0,0 +1,194 @@
+import os
+import re
+import shutil
+import tempfile
+
+SPECIAL_KEYS = ['__COMMENT__', '__EMPTY_LINE__']
+
+_ESCAPE_SEQUENCE = re.compile(r'\\(u[0-9a-fA-F]{4}|.)', re.DOTALL)
+_UNESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'f': '\f'}
+_SURROGATE = re.compile('[\ud800-\udfff]')
+_VALUE_SPECIAL = re.compile(r'[\\\n\r\t\f]')
+_KEY_SPECIAL = re.compile(r'[\\\n\r\t\f =:#!]')
+_ESCAPES = {'\\': '\\\\', '\n': '\\n', '\r': '\\r', '\t': '\\t', '\f': '\\f',
+            ' ': '\\ ', '=': '\\=', ':': '\\:', '#': '\\#', '!': '\\!'}
+_WHITESPACE = ' \t\f'
+
+
+def _replace_escape(match):
+    sequence = match.group(1)
+    if len(sequence) == 5:
+        return chr(int(sequence[1:], 16))
+    return _UNESCAPES.get(sequence, sequence)
+
+
+def unescape(text):
+    if '\\' not in text:
+        return text
+    text = _ESCAPE_SEQUENCE.sub(_replace_escape, text)
+    if _SURROGATE.search(text):
+        # Characters outside the BMP are escaped as UTF-16 surrogate pairs; unpaired halves become U+FFFD.
+        text = text.encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'replace')
+    return text
+
+
+def escape_value(value):
+    if _VALUE_SPECIAL.search(value):
+        value = _VALUE_SPECIAL.sub(lambda match: _ESCAPES[match.group(0)], value)
+    if value.startswith(' '):
+        value = '\\' + value
+    if value.endswith(' ') and not _has_continuation(value[:-1]):
+        value = value[:-1] + '\\ '
+    return value
+
+
+def escape_key(key):
+    if _KEY_SPECIAL.search(key):
+        key = _KEY_SPECIAL.sub(lambda match: _ESCAPES[match.group(0)], key)
+    return key
+
+
+def format_entry(key, value):
+    return f"{escape_key(key)}={escape_value(value)}"
+
+
+def _has_continuation(line):
+    backslashes = len(line) - len(line.rstrip('\\'))
+    return backslashes % 2 == 1
+
+
+def _split_key_value(line):
+    length = len(line)
+    index = 0
+    while index < length:
+        char = line[index]
+        if char == '\\':
+            index += 2
+            continue
+        if char in '=:' or char in _WHITESPACE:
+            break
+        index += 1
+
+    key = line[:index]
+    rest = line[index:].lstrip(_WHITESPACE)
+    has_separator = index < length
+    if rest[:1] in ('=', ':'):
+        rest = rest[1:].lstrip(_WHITESPACE)
+
+    stripped = rest.rstrip()
+    if len(stripped) < len(rest) and _has_continuation(stripped):
+        stripped += rest[len(stripped)]
+
+    return key, stripped, has_separator and bool(key)
+
+
+def iter_properties(lines, warning_callback=None):
+    pending = None
+    start_line = 0
+
+    for line_num, raw_line in enumerate(lines, 1):
+        line = raw_line.rstrip('\r\n')
+
+        if pending is None:
+            stripped = line.lstrip(_WHITESPACE)
+            if not stripped:
+                yield ('__EMPTY_LINE__', '')
+                continue
+            if stripped[0] in '#!':
+                yield ('__COMMENT__', line)
+                continue
+            pending = stripped
+            start_line = line_num
+        else:
+            pending += line.lstrip(_WHITESPACE)
+
+        if _has_continuation(pending):
+            pending = pending[:-1]
+            continue
+
+        entry = _parse_logical_line(pending, start_line, warning_callback)
+        pending = None
+        if entry is not None:
+            yield entry
+
+    if pending is not None:
+        entry = _parse_logical_line(pending, start_line, warning_callback)
+        if entry is not None:
+            yield entry
+
+
+def _parse_logical_line(line, line_num, warning_callback):
+    key, value, valid = _split_key_value(line)
+    if not valid:
+        if warning_callback:
+            warning_callback(f"Warning: Invalid format on line {line_num}: {line}")
+        return None
+    return (unescape(key), unescape(value))
+
+
+def iter_chunks(entries, chunk_size):
+    chunk = []
+    for entry in entries:
+        chunk.append(entry)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def render_entry_lines(entries, translate_value):
+    for key, value in entries:
+        if key == '__COMMENT__':
+            yield value
+        elif key == '__EMPTY_LINE__':
+            yield ''
+        else:
+            translated = translate_value(key, value)
+            if translated is not None:
+                yield format_entry(key, translated)
+
+
+class AtomicPropertiesWriter:
+    def __init__(self, path, append=False):
+        self.path = path
+        self.lines_written = 0
+        self.bytes_written = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+        self._file = os.fdopen(fd, 'w', encoding='utf-8', newline='\n')
+
+        if append and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', newline='') as existing:
+                shutil.copyfileobj(existing, self._file)
+            self._file.write('\n')
+
+    def write_lines(self, lines):
+        for line in lines:
+            self._file.write(line + '\n')
+            self.lines_written += 1
+            self.bytes_written += len(line.encode('utf-8')) + 1
+
+    def commit(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self):
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
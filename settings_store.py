@@ -0,0 +1,255 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+from batch_scheduler import PRIORITIES
+from translation_plan import DEFAULT_SKIP_RULES
+
+NUMBER = (int, float)
+OPTIONAL_PATH = (str, type(None))
+
+SETTINGS_SCHEMA = {
+    "batch_max_chars": int,
+    "batch_max_items": int,
+    "max_workers": int,
+    "worker_chunk_size": int,
+    "requests_per_second": NUMBER,
+    "rate_limit_burst": int,
+    "max_in_flight": int,
+    "max_retries": int,
+    "retry_base_delay": NUMBER,
+    "retry_max_delay": NUMBER,
+    "incremental": bool,
+    "stream_chunk_size": int,
+    "source_language": str,
+    "skip_rules": dict,
+    "protect_placeholders": bool,
+    "translation_backends": list,
+    "backend_options": dict,
+    "batch_priority": str,
+    "batch_output_pattern": str,
+    "resume_runs": bool,
+    "journal_path": OPTIONAL_PATH,
+    "glossary_path": OPTIONAL_PATH,
+    "profile_path": OPTIONAL_PATH,
+    "export_formats": list,
+    "translation_memory_path": str,
+    "translation_memory_size": int,
+    "verify_max_length_ratio": NUMBER,
+    "verify_allow_identical": dict,
+    "language_combinations": list
+}
+
+CHOICES = {
+    "batch_priority": PRIORITIES
+}
+
+
+class SettingsError(ValueError):
+    pass
+
+
+def type_name(expected):
+    if isinstance(expected, tuple):
+        return " or ".join(t.__name__ for t in expected if t is not type(None))
+    return expected.__name__
+
+
+def validate_settings(settings):
+    if not isinstance(settings, dict):
+        return ["settings must be a JSON object"]
+
+    errors = []
+    for key, expected in SETTINGS_SCHEMA.items():
+        if key not in settings:
+            continue
+        value = settings[key]
+        if isinstance(value, bool) and expected is not bool:
+            errors.append(f"'{key}' must be {type_name(expected)}, not a boolean")
+        elif not isinstance(value, expected):
+            errors.append(f"'{key}' must be {type_name(expected)}")
+        elif isinstance(value, NUMBER) and not isinstance(value, bool) and value < 0:
+            errors.append(f"'{key}' must not be negative")
+        elif key in CHOICES and value not in CHOICES[key]:
+            errors.append(f"'{key}' must be one of {', '.join(CHOICES[key])}")
+
+    for index, combo in enumerate(settings.get("language_combinations", [])
+                                  if isinstance(settings.get("language_combinations"), list) else []):
+        if not isinstance(combo, dict):
+            errors.append(f"language_combinations[{index}] must be an object")
+            continue
+        for field in ("language", "output_path"):
+            if not isinstance(combo.get(field), str) or not combo.get(field):
+                errors.append(f"language_combinations[{index}].{field} must be a non-empty string")
+        if not isinstance(combo.get("enabled", True), bool):
+            errors.append(f"language_combinations[{index}].enabled must be true or false")
+
+    skip_rules = settings.get("skip_rules", {})
+    for name, value in (skip_rules.items() if isinstance(skip_rules, dict) else []):
+        if name not in DEFAULT_SKIP_RULES:
+            errors.append(f"skip_rules.{name} is not a known rule")
+        elif name != "patterns":
+            if not isinstance(value, bool):
+                errors.append(f"skip_rules.{name} must be true or false")
+        elif not isinstance(value, list) or not all(isinstance(pattern, str) for pattern in value):
+            errors.append("skip_rules.patterns must be a list of strings")
+        else:
+            for pattern in value:
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    errors.append(f"skip_rules.patterns has an invalid pattern {pattern!r}: {str(e)}")
+
+    allow_identical = settings.get("verify_allow_identical", {})
+    for language, values in (allow_identical.items() if isinstance(allow_identical, dict) else []):
+        if not isinstance(values, list) or not all(isinstance(value, str) for value in values):
+            errors.append(f"verify_allow_identical.{language} must be a list of strings")
+
+    return errors
+
+
+def read_settings(path):
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            settings = json.load(f)
+    except ValueError as e:
+        raise SettingsError(f"{path} is not valid JSON: {str(e)}")
+
+    errors = validate_settings(settings)
+    if errors:
+        raise SettingsError(f"Invalid settings in {path}: {'; '.join(errors)}")
+    return settings
+
+
+def write_settings(path, settings):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(settings, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class SettingsStore:
+    def __init__(self, path, defaults, save_delay=0.5):
+        self.path = path
+        self.defaults = defaults
+        self.save_delay = save_delay
+        self.load_error = None
+        self.save_error = None
+        self._dirty = False
+        self._writing = False
+        self._deadline = 0.0
+        self._closed = False
+        self._writer = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self.settings = self.load()
+
+    def load(self):
+        try:
+            settings = read_settings(self.path)
+        except SettingsError as e:
+            self.load_error = str(e)
+            shutil.copyfile(self.path, self.path + ".corrupt")
+            settings = None
+
+        self._signature = file_signature(self.path)
+        if settings is None:
+            settings = json.loads(json.dumps(self.defaults))
+        return settings
+
+    def schedule_save(self):
+        with self._condition:
+            self._dirty = True
+            self._deadline = time.monotonic() + self.save_delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, daemon=True)
+                self._writer.start()
+            self._condition.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._dirty or time.monotonic() < self._deadline):
+                    timeout = self._deadline - time.monotonic() if self._dirty else None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._condition:
+                if not self._dirty:
+                    return
+                try:
+                    snapshot = json.loads(json.dumps(self.settings))
+                except RuntimeError:
+                    return
+                self._dirty = False
+                self._writing = True
+
+            try:
+                write_settings(self.path, snapshot)
+                signature = file_signature(self.path)
+            except Exception as e:
+                signature = self._signature
+                self.save_error = str(e)
+            with self._condition:
+                self._signature = signature
+                self._writing = False
+
+    def take_save_error(self):
+        error, self.save_error = self.save_error, None
+        return error
+
+    def pending(self):
+        with self._condition:
+            return self._dirty or self._writing
+
+    def check_for_changes(self):
+        with self._condition:
+            if self._dirty or self._writing:
+                return None
+            signature = file_signature(self.path)
+            if signature is None or signature == self._signature:
+                return None
+            self._signature = signature
+
+        return read_settings(self.path)
+
+    def replace(self, settings):
+        with self._condition:
+            self.settings.clear()
+            self.settings.update(settings)
+        return self.settings
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
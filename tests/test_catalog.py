@@ -0,0 +1,65 @@
+import gettext
+import os
+
+import pytest
+
+from catalog import Catalog, export_properties, write_catalog, write_mo
+
+TRANSLATIONS = {"b.key": "Bé", "a.key": "Alpha", "empty": "", "same": "Alpha", "日本": "語"}
+
+
+def test_catalog_lookup(tmp_path):
+    path = str(tmp_path / "fr.lcat")
+    write_catalog(path, TRANSLATIONS)
+
+    with Catalog(path) as catalog:
+        assert len(catalog) == len(TRANSLATIONS)
+        assert catalog["b.key"] == "Bé"
+        assert catalog.get("日本") == "語"
+        assert catalog.get("empty") == ""
+        assert catalog.get("missing", "fallback") == "fallback"
+        assert "a.key" in catalog and "zzz" not in catalog
+        with pytest.raises(KeyError):
+            catalog["missing"]
+        assert dict(catalog.items()) == TRANSLATIONS
+        assert list(catalog.keys()) == sorted(TRANSLATIONS, key=lambda key: key.encode('utf-8'))
+
+
+def test_empty_catalog(tmp_path):
+    path = str(tmp_path / "empty.lcat")
+    write_catalog(path, {})
+
+    with Catalog(path) as catalog:
+        assert len(catalog) == 0
+        assert catalog.get("a") is None
+
+
+def test_catalog_rejects_other_files(tmp_path):
+    path = tmp_path / "bad.lcat"
+    path.write_bytes(b"NOPE" + bytes(16))
+
+    with pytest.raises(ValueError):
+        Catalog(str(path))
+
+
+def test_mo_is_readable_by_gettext(tmp_path):
+    path = str(tmp_path / "fr.mo")
+    write_mo(path, TRANSLATIONS)
+
+    with open(path, 'rb') as f:
+        translations = gettext.GNUTranslations(f)
+    assert translations.gettext("b.key") == "Bé"
+    assert translations.gettext("日本") == "語"
+    assert translations.gettext("missing") == "missing"
+    assert translations.info()["content-type"] == "text/plain; charset=UTF-8"
+
+
+def test_export_properties_uses_last_value(tmp_path):
+    source = tmp_path / "fr.properties"
+    source.write_text("# c\na=1\nb=2\na=3\n", encoding='utf-8')
+
+    paths = export_properties(str(source), ["catalog", "mo"])
+
+    assert [os.path.basename(path) for path in paths] == ["fr.lcat", "fr.mo"]
+    with Catalog(paths[0]) as catalog:
+        assert dict(catalog.items()) == {"a": "3", "b": "2"}
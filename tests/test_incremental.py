@@ -0,0 +1,47 @@
+from incremental import compute_delta, index_entries, merge_output_lines, source_hash
+
+
+def test_compute_delta_classifies_keys():
+    source = {"a": "A", "b": "B changed", "c": "C", "d": "D"}
+    output = {"a": "x", "b": "y", "c": "z", "old": "w"}
+    manifest = {"a": source_hash("A"), "b": source_hash("B")}
+
+    delta = compute_delta(source, output, manifest)
+
+    assert delta.added == ["d"]
+    assert delta.changed == ["b"]
+    assert delta.unchanged == ["a", "c"]
+    assert delta.removed == ["old"]
+    assert delta.keys_to_translate() == ["d", "b"]
+
+
+def test_compute_delta_keeps_missing_keys_when_asked():
+    delta = compute_delta({"a": "A"}, {"a": "x", "old": "w"}, {}, remove_missing=False)
+
+    assert delta.removed == []
+
+
+def test_merge_inserts_new_keys_after_preceding_source_key():
+    source = [("a", "A"), ("b", "B"), ("c", "C")]
+    output = [("__COMMENT__", "# fr"), ("a", "xa"), ("c", "xc")]
+
+    lines = merge_output_lines(source, output, {"b": "xb"}, [])
+
+    assert lines == ["# fr", "a=xa", "b=xb", "c=xc"]
+
+
+def test_merge_inserts_leading_keys_before_first_key():
+    source = [("new", "N"), ("a", "A")]
+    output = [("__COMMENT__", "# fr"), ("a", "xa")]
+
+    assert merge_output_lines(source, output, {"new": "xn"}, []) == ["# fr", "new=xn", "a=xa"]
+
+
+def test_merge_updates_removes_and_collapses_duplicates():
+    source = [("a", "A"), ("b", "B")]
+    output = [("a", "old"), ("b", "xb"), ("__EMPTY_LINE__", ""), ("gone", "g"), ("a", "latest")]
+
+    lines = merge_output_lines(source, output, {"b": "new b"}, ["gone"])
+
+    assert lines == ["a=latest", "b=new b", ""]
+    assert index_entries([("a", "1"), ("__COMMENT__", "#"), ("a", "2")]) == {"a": "2"}
@@ -0,0 +1,65 @@
+import pytest
+
+from placeholders import (find_placeholders, mask_placeholders, mask_with_tokens, missing_tokens, placeholders_match,
+                          strip_tokens, unmask_placeholders)
+from translation_plan import SkipRules
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello {0}, you have {count} items", ["{0}", "{count}"]),
+    ("Dear {{name}} from ${city}", ["{{name}}", "${city}"]),
+    ("%s of %d (%1$s, %.2f, %-5d, 100%%)", ["%s", "%d", "%1$s", "%.2f", "%-5d", "%%"]),
+    ("<b>Save</b> now<br/> &amp; later", ["<b>", "</b>", "<br/>", "&amp;"]),
+])
+def test_find_placeholders(text, expected):
+    assert find_placeholders(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "50% discount",
+    "100% sure",
+    "10% complete",
+    "50 % Rabatt",
+    "x < 5 and y > 3",
+    "a <= b >= c",
+])
+def test_prose_is_not_masked(text):
+    assert find_placeholders(text) == []
+    assert mask_placeholders(text) == (text, [])
+
+
+def test_mask_round_trip():
+    text = "Save <b>{0}</b> (%d%%)"
+    masked, tokens = mask_placeholders(text)
+
+    assert masked == "Save __PH0____PH1____PH2__ (__PH3____PH4__)"
+    assert unmask_placeholders(masked, tokens) == text
+
+
+def test_mask_with_tokens_follows_source_numbering():
+    masked, tokens = mask_placeholders("{0} of {1} {0}")
+
+    assert mask_with_tokens("{1} von {0} {0} {2}", tokens) == "__PH1__ von __PH0__ __PH2__ {2}"
+
+
+def test_unmask_tolerates_spaced_and_cased_tokens():
+    assert unmask_placeholders("Bonjour __ph0__ et _ _PH 1_ _", ["{0}", "{1}"]) == "Bonjour {0} et {1}"
+
+
+def test_missing_tokens_and_strip_tokens():
+    assert missing_tokens("Hello __PH1__", ["{0}", "{1}"]) == [0]
+    assert strip_tokens("a __PH0__ b") == "a  b"
+
+
+def test_placeholders_match_ignores_order_but_not_count():
+    assert placeholders_match("{0} of {1}", "{1} von {0}")
+    assert not placeholders_match("{0} of {1}", "{0} von")
+    assert placeholders_match("50% discount", "50 % Rabatt")
+
+
+def test_skip_rules_do_not_treat_percent_prose_as_placeholders():
+    rules = SkipRules()
+
+    assert rules.should_skip("{0} %s")
+    assert not rules.should_skip("100% sure")
+    assert not rules.should_skip("x < 5 and y > 3")
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from properties_io import (AtomicPropertiesWriter, escape_value, format_entry, iter_chunks, iter_properties,
+                           render_entry_lines, unescape)
+
+
+def parse(text):
+    return list(iter_properties(text.split('\n')))
+
+
+def test_parses_separators_comments_and_blank_lines():
+    entries = parse("# comment\n! bang\n\na=1\nb : 2\nc 3\nd=")
+
+    assert entries == [("__COMMENT__", "# comment"), ("__COMMENT__", "! bang"), ("__EMPTY_LINE__", ""),
+                       ("a", "1"), ("b", "2"), ("c", "3"), ("d", "")]
+
+
+def test_parses_continuations_and_escapes():
+    entries = parse("long=first \\\n    second\nkey\\ with\\:colon=tab\\there \\u00e9\\\\")
+
+    assert entries == [("long", "first second"), ("key with:colon", "tab\there é\\")]
+
+
+def test_joins_surrogate_pair_escapes():
+    assert parse("emoji=Smile \\uD83D\\uDE00\nlone=\\ud83d!") == [("emoji", "Smile \U0001F600"), ("lone", "\ufffd!")]
+    assert format_entry("emoji", unescape("\\uD83D\\uDE00")).encode('utf-8') == "emoji=\U0001F600".encode('utf-8')
+
+
+def test_warns_about_invalid_lines():
+    warnings = []
+
+    assert list(iter_properties(["justakey", "=novalue"], warnings.append)) == []
+    assert len(warnings) == 2
+
+
+@pytest.mark.parametrize("value", [" items", "line\nbreak", "back\\slash", "tab\tend", "trailing ", " ", "two  ", "slash\\ "])
+def test_escape_round_trip(value):
+    assert parse(format_entry("k", value)) == [("k", value)]
+
+
+def test_escape_value_keeps_leading_space():
+    assert escape_value(" items") == "\\ items"
+    assert unescape("\\ items") == " items"
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_render_entry_lines_skips_untranslated_entries():
+    entries = [("__COMMENT__", "# c"), ("__EMPTY_LINE__", ""), ("a", "A"), ("b", "B")]
+    lines = render_entry_lines(entries, lambda key, value: None if key == "b" else value.lower())
+
+    assert list(lines) == ["# c", "", "a=a"]
+
+
+def test_atomic_writer_replaces_only_on_commit(tmp_path):
+    path = str(tmp_path / "out.properties")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("old=1\n")
+
+    writer = AtomicPropertiesWriter(path)
+    writer.write_lines(["new=2"])
+    writer.abort()
+    assert open(path, encoding='utf-8').read() == "old=1\n"
+
+    with AtomicPropertiesWriter(path, append=True) as writer:
+        writer.write_lines(["new=2"])
+    assert parse(open(path, encoding='utf-8').read()) == [("old", "1"), ("__EMPTY_LINE__", ""), ("new", "2"),
+                                                          ("__EMPTY_LINE__", "")]
+    assert os.listdir(tmp_path) == ["out.properties"]
@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+
+import pytest
+
+import settings_store
+from settings_store import SettingsError, SettingsStore, read_settings, validate_settings
+
+DEFAULTS = {"language_combinations": []}
+
+
+def test_validate_settings_reports_each_problem():
+    errors = validate_settings({
+        "max_workers": True,
+        "requests_per_second": -1,
+        "batch_priority": "random",
+        "language_combinations": [{"language": "", "output_path": "a"}, 3,
+                                  {"language": "French", "output_path": "f", "enabled": "yes"}]
+    })
+
+    assert len(errors) == 6
+
+
+def test_validate_skip_rules():
+    assert validate_settings({"skip_rules": {"numbers": False, "patterns": ["^[A-Z]+$"]}}) == []
+
+    errors = validate_settings({"skip_rules": {"numbers": "no", "emails": True, "patterns": ["(", "ok"]}})
+    assert len(errors) == 3
+    assert validate_settings({"skip_rules": {"patterns": "^x$"}}) == ["skip_rules.patterns must be a list of strings"]
+
+
+def test_repo_settings_file_is_valid():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "localizer_settings.json")
+    assert read_settings(path) is not None
+
+
+def test_read_settings_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "settings.json"
+    assert read_settings(str(path)) is None
+
+    path.write_text("{oops", encoding='utf-8')
+    with pytest.raises(SettingsError):
+        read_settings(str(path))
+
+
+def test_corrupt_file_falls_back_to_defaults_and_is_kept(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{oops", encoding='utf-8')
+
+    store = SettingsStore(str(path), DEFAULTS)
+
+    assert store.load_error
+    assert store.settings == DEFAULTS and store.settings is not DEFAULTS
+    assert (tmp_path / "settings.json.corrupt").read_text(encoding='utf-8') == "{oops"
+
+
+def test_saves_are_coalesced(tmp_path, monkeypatch):
+    path = str(tmp_path / "settings.json")
+    writes = []
+    write_settings = settings_store.write_settings
+    monkeypatch.setattr(settings_store, "write_settings", lambda *args: (writes.append(1), write_settings(*args)))
+    store = SettingsStore(path, DEFAULTS, save_delay=60)
+
+    for index in range(50):
+        store.settings["incremental"] = bool(index % 2)
+        store.schedule_save()
+    store.close()
+
+    assert len(writes) == 1
+    assert json.load(open(path, encoding='utf-8'))["incremental"] is True
+    assert os.listdir(tmp_path) == ["settings.json"]
+
+
+def test_external_changes_are_reloaded_but_own_writes_are_not(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"incremental": False}), encoding='utf-8')
+    store = SettingsStore(str(path), DEFAULTS, save_delay=0)
+    settings = store.settings
+
+    store.settings["incremental"] = True
+    store.schedule_save()
+    store.close()
+    assert store.check_for_changes() is None
+
+    path.write_text(json.dumps({"incremental": False, "max_workers": 2}), encoding='utf-8')
+    os.utime(path, ns=(0, 0))
+    changed = store.check_for_changes()
+    assert changed == {"incremental": False, "max_workers": 2}
+    assert store.settings == {"incremental": True}
+    assert store.replace(changed) is settings
+    assert settings == changed
+
+
+def test_write_in_progress_is_not_reported_as_external(tmp_path, monkeypatch):
+    path = str(tmp_path / "settings.json")
+    store = SettingsStore(path, DEFAULTS)
+    replaced = threading.Event()
+    resume = threading.Event()
+    write_settings = settings_store.write_settings
+
+    def slow_write(*args):
+        write_settings(*args)
+        replaced.set()
+        resume.wait(5)
+
+    monkeypatch.setattr(settings_store, "write_settings", slow_write)
+    store.settings["incremental"] = True
+    store._dirty = True
+    writer = threading.Thread(target=store.flush)
+    writer.start()
+    replaced.wait(5)
+
+    assert store.pending()
+    assert store.check_for_changes() is None
+
+    resume.set()
+    writer.join()
+    assert not store.pending()
+    assert store.check_for_changes() is None
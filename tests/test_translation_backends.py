@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from placeholders import mask_placeholders
+from translation_backends import FailoverClient, PhrasebookBackend, TranslationUnavailable, create_backends
+
+
+@pytest.fixture
+def phrasebook(tmp_path):
+    path = tmp_path / "phrasebook.json"
+    path.write_text(json.dumps({
+        "Hello {0}": {"fr": "Bonjour {0}"},
+        "<b>Save</b>": {"fr": "<b>Enregistrer</b>"},
+        "{0} of {1}": {"de": "{1} von {0}"},
+        "Cancel": {"fr": "Annuler"}
+    }), encoding='utf-8')
+    return PhrasebookBackend({"path": str(path)})
+
+
+def test_phrasebook_translates_masked_values(phrasebook):
+    client = phrasebook.create_client()
+
+    for source, lang, expected in [("Hello {0}", "fr", "Bonjour __PH0__"),
+                                   ("<b>Save</b>", "fr", "__PH0__Enregistrer__PH1__"),
+                                   ("{0} of {1}", "de", "__PH1__ von __PH0__")]:
+        masked, tokens = mask_placeholders(source)
+        assert client.translate(masked, dest=lang).text == expected
+
+
+def test_phrasebook_translates_unmasked_values_and_batches(phrasebook):
+    client = phrasebook.create_client()
+
+    assert client.translate("Cancel\nHello {0}", dest="fr").text == "Annuler\nBonjour {0}"
+    with pytest.raises(TranslationUnavailable):
+        client.translate("Unknown", dest="fr")
+
+
+def test_phrasebook_languages(phrasebook):
+    assert phrasebook.supported_languages() == {"fr", "de"}
+
+
+def test_failover_falls_through_to_next_backend(phrasebook):
+    client = FailoverClient([phrasebook] + create_backends({"translation_backends": ["fake"]}))
+
+    assert client.translate("Cancel", dest="fr").text == "Annuler"
+    assert client.last_backend == "phrasebook"
+    assert client.translate("Unknown", dest="fr").text != "Unknown"
+    assert client.last_backend == "fake"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_backends({"translation_backends": ["nope"]})
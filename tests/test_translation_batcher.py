@@ -0,0 +1,33 @@
+from translation_batcher import BatchTranslator, make_batches
+
+
+class Result:
+    def __init__(self, text):
+        self.text = text
+
+
+class PaddingTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def translate(self, text, dest):
+        self.calls.append(text)
+        return Result("\n".join(f" <{line.strip()}> \r" for line in text.split("\n")))
+
+
+def test_make_batches_respects_item_limit():
+    assert list(make_batches(["a", "b", "c"], max_items=2)) == [["a", "b"], ["c"]]
+
+
+def test_batch_keeps_source_padding():
+    translator = PaddingTranslator()
+    results = BatchTranslator(translator).translate_many([" items", "Save ", "plain"], "fr")
+
+    assert results == {" items": " <items>", "Save ": "<Save> ", "plain": "<plain>"}
+    assert len(translator.calls) == 1
+
+
+def test_single_value_keeps_source_padding():
+    results = BatchTranslator(PaddingTranslator()).translate_many(["  indented"], "fr")
+
+    assert results == {"  indented": "  <indented>"}
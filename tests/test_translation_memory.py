@@ -0,0 +1,45 @@
+from localizer_engine import LocalizationEngine
+from translation_backends import Translation
+from translation_memory import TranslationMemory
+
+
+class EchoClient:
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, text, dest='en'):
+        self.calls += 1
+        return Translation(f"[{dest}] {text}", dest)
+
+
+def test_entries_are_keyed_by_source_language(tmp_path):
+    memory = TranslationMemory(str(tmp_path / "tm.db"), max_entries=1)
+    memory.put("Chat", "fr", "Chat", "en")
+    memory.put_many({"Chat": "Katze", "Hund": "Hund"}, "fr", "de")
+
+    assert memory.get("Chat", "fr", "en") == "Chat"
+    assert memory.peek("Chat", "fr", "de") == "Katze"
+    memory.discard_many(["Chat"], "fr", "de")
+    assert memory.get("Chat", "fr", "de") is None
+    assert memory.get("Chat", "fr", "en") == "Chat"
+    memory.close()
+
+
+def test_engine_uses_the_configured_source_language(tmp_path):
+    client = EchoClient()
+    settings = {"translation_memory_path": str(tmp_path / "tm.db"), "resume_runs": False, "glossary_path": None,
+                "requests_per_second": 0}
+    engine = LocalizationEngine(settings, translator_factory=lambda: client)
+    try:
+        assert engine.translate_text("Chat", "fr") == "[fr] Chat"
+        assert engine.translate_text("Chat", "fr") == "[fr] Chat"
+        assert client.calls == 1
+        assert engine.translation_memory.peek("Chat", "fr", "en") == "[fr] Chat"
+
+        settings["source_language"] = "German"
+        assert engine.cached_translation("Chat", "French") is None
+        engine.translate_text("Chat", "fr")
+        assert client.calls == 2
+        assert engine.translation_memory.peek("Chat", "fr", "de") == "[fr] Chat"
+    finally:
+        engine.close()
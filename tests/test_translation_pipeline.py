@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+import pytest
+
+from translation_backends import Translation, TranslationUnavailable
+from translation_pipeline import TranslationFailed, TranslationPipeline
+
+
+class FlakyClient:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def translate(self, text, dest='en'):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return Translation(text.upper(), dest)
+
+
+def run(pipeline, text="hi"):
+    try:
+        return asyncio.run(pipeline.translate(text, "fr"))
+    finally:
+        pipeline.shutdown()
+
+
+def test_transient_errors_are_retried():
+    client = FlakyClient([json.JSONDecodeError("Expecting value", "<html>", 0), ConnectionError("reset")])
+    pipeline = TranslationPipeline(lambda: client, requests_per_second=0, max_retries=2, base_delay=0)
+
+    assert run(pipeline).text == "HI"
+    assert client.calls == 3 and pipeline.retries == 2
+
+
+def test_unavailable_translations_are_not_retried():
+    client = FlakyClient([TranslationUnavailable("no entry")])
+    pipeline = TranslationPipeline(lambda: client, requests_per_second=0, max_retries=2, base_delay=0)
+
+    with pytest.raises(TranslationUnavailable):
+        run(pipeline)
+    assert client.calls == 1
+
+
+def test_gives_up_after_max_retries():
+    client = FlakyClient([ValueError("garbled")] * 3)
+    pipeline = TranslationPipeline(lambda: client, requests_per_second=0, max_retries=1, base_delay=0)
+
+    with pytest.raises(TranslationFailed):
+        run(pipeline)
+    assert client.calls == 2 and pipeline.failures == 1
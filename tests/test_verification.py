@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from verification import init_worker, summarize, verification_options, verification_tasks, verify_output
+
+SOURCE = "title=Settings\nmenu=Menu\ncount={count} files\nlimit=100\nhelp=Open help\n"
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "in.properties"
+    path.write_text(SOURCE, encoding='utf-8')
+    init_worker({})
+    return str(path)
+
+
+def write_output(tmp_path, text, name="fr.properties"):
+    path = tmp_path / name
+    path.write_bytes(text.encode('utf-8') if isinstance(text, str) else text)
+    return str(path)
+
+
+def verify(source, output_path, language="French", target_lang="fr", translated=True):
+    return verify_output((source, language, target_lang, output_path, translated))
+
+
+def test_clean_output(source, tmp_path):
+    output = write_output(tmp_path, "title=Paramètres\nmenu=Menu à\ncount={count} fichiers\nlimit=100\nhelp=Aide\n")
+    result = verify(source, output)
+
+    assert result["exists"] and result["keys"] == 5
+    assert not any(result["issues"].values())
+    assert result["retranslate"] == []
+
+
+def test_missing_file(source, tmp_path):
+    result = verify(source, str(tmp_path / "absent.properties"))
+
+    assert not result["exists"]
+    assert result["issues"]["missing"] == ["title", "menu", "count", "limit", "help"]
+    assert result["retranslate"] == result["issues"]["missing"]
+
+
+def test_missing_extra_and_duplicate_keys(source, tmp_path):
+    output = write_output(tmp_path, "title=A\ntitle=B\nmenu=Carte\ncount={count} fichiers\nlimit=100\nold=Vieux\n")
+    issues = verify(source, output)["issues"]
+
+    assert issues["missing"] == ["help"]
+    assert issues["extra"] == ["old"]
+    assert issues["duplicate"] == ["title"]
+
+
+def test_untranslated_values(source, tmp_path):
+    output = write_output(tmp_path, "title=Settings\nmenu=Menu\ncount={count} files\nlimit=100\nhelp=Aide\n")
+    result = verify(source, output)
+
+    assert result["issues"]["untranslated"] == ["title", "menu", "count"]
+    assert result["retranslate"] == ["title", "menu", "count"]
+    assert verify(source, output, translated=False)["issues"]["untranslated"] == []
+
+
+def test_untranslated_allowed_by_skip_rules_and_glossary(source, tmp_path):
+    glossary = tmp_path / "glossary.json"
+    glossary.write_text(json.dumps({"protected": ["Settings"]}), encoding='utf-8')
+    init_worker({"skip_rules": {"patterns": ["^Menu$"]}, "glossary_path": str(glossary)})
+    output = write_output(tmp_path, "title=Settings\nmenu=Menu\ncount={count} files\nlimit=100\nhelp=Aide\n")
+
+    assert verify(source, output)["issues"]["untranslated"] == ["count"]
+
+
+def test_untranslated_allowed_per_language(source, tmp_path):
+    init_worker({"allow_identical": {"French": ["Menu"], "*": ["Settings"]}})
+    output = write_output(tmp_path, "title=Settings\nmenu=Menu\ncount={count} fichiers\nlimit=100\nhelp=Aide\n")
+
+    assert verify(source, output)["issues"]["untranslated"] == []
+    assert verify(source, output, language="German", target_lang="de")["issues"]["untranslated"] == ["menu"]
+
+
+def test_placeholder_mismatch(source, tmp_path):
+    output = write_output(tmp_path, "title=Paramètres\nmenu=Carte\ncount={nombre} fichiers\nlimit=100\nhelp=Aide\n")
+
+    assert verify(source, output)["issues"]["placeholders"] == ["count"]
+
+
+def test_encoding_issues(source, tmp_path):
+    output = write_output(tmp_path, "title=ParamÃ¨tres\nmenu=Carte\ncount={count} fichiers\nlimit=100\n".encode('utf-8')
+                          + b"help=Aide \xff\n")
+
+    assert verify(source, output)["issues"]["encoding"] == ["title", "help"]
+
+
+def test_length_ratio(source, tmp_path):
+    output = write_output(tmp_path, "title=" + "x" * 31 + "\nmenu=Carte\ncount={count} fichiers\nlimit=100\n"
+                          "help=" + "y" * 30 + "\n")
+
+    assert verify(source, output)["issues"]["length"] == ["title"]
+    init_worker({"max_length_ratio": 10})
+    assert verify(source, output)["issues"]["length"] == []
+
+
+def test_tasks_and_summary(source, tmp_path):
+    output = write_output(tmp_path, "title=Paramètres\n")
+    sources = [(source, [("English", source), ("French", output)])]
+    tasks = verification_tasks(sources, {"English": "en", "French": "fr"}, "English")
+
+    assert tasks == [(source, "English", "en", source, False), (source, "French", "fr", output, True)]
+    init_worker(verification_options({"glossary_path": None}))
+    summary = summarize([verify_output(task) for task in tasks])
+    assert summary["files"] == 2 and summary["failed_files"] == 1
+    assert summary["issues"]["missing"] == 4
@@ -0,0 +1,214 @@
+import json
+import os
+import urllib.parse
+import urllib.request
+
+from fake_translator import FakeTranslator
+from placeholders import mask_placeholders, mask_with_tokens
+
+BACKENDS = {}
+
+
+class TranslationUnavailable(ValueError):
+    pass
+
+
+class Translation:
+    def __init__(self, text, dest, src='auto'):
+        self.text = text
+        self.dest = dest
+        self.src = src
+
+
+def register_backend(cls):
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+class TranslationBackend:
+    name = None
+    is_local = False
+    max_batch_chars = 4500
+    max_batch_items = 50
+    max_concurrency = 8
+    languages = None
+
+    def __init__(self, options=None):
+        self.options = options or {}
+
+    def supports(self, lang_code):
+        languages = self.supported_languages()
+        return languages is None or lang_code in languages
+
+    def supported_languages(self):
+        return self.options.get("languages", self.languages)
+
+    def capabilities(self):
+        languages = self.supported_languages()
+        return {
+            "name": self.name,
+            "local": self.is_local,
+            "max_batch_chars": self.options.get("max_batch_chars", self.max_batch_chars),
+            "max_batch_items": self.options.get("max_batch_items", self.max_batch_items),
+            "max_concurrency": self.options.get("max_concurrency", self.max_concurrency),
+            "languages": sorted(languages) if languages is not None else None
+        }
+
+    def create_client(self):
+        raise NotImplementedError
+
+
+@register_backend
+class GoogleTransBackend(TranslationBackend):
+    name = "googletrans"
+    max_batch_chars = 4500
+    max_batch_items = 50
+    max_concurrency = 8
+
+    def create_client(self):
+        from googletrans import Translator
+        return Translator()
+
+
+@register_backend
+class FakeBackend(TranslationBackend):
+    name = "fake"
+    is_local = True
+    max_batch_chars = 100000
+    max_batch_items = 500
+    max_concurrency = 64
+
+    def create_client(self):
+        return FakeTranslator(
+            self.options.get("latency", 0.0),
+            self.options.get("failure_rate", 0.0),
+            latency_jitter=self.options.get("latency_jitter", 0.0)
+        )
+
+
+class PhrasebookClient:
+    def __init__(self, phrases):
+        self.phrases = phrases
+
+    def translate(self, text, dest='en', src='auto'):
+        lines = []
+        for line in text.split("\n"):
+            translations = self.phrases.get(line.strip(), {})
+            if dest not in translations:
+                raise TranslationUnavailable(f"No phrasebook entry for '{line.strip()}' in '{dest}'")
+            lines.append(translations[dest])
+        return Translation("\n".join(lines), dest, src)
+
+
+@register_backend
+class PhrasebookBackend(TranslationBackend):
+    name = "phrasebook"
+    is_local = True
+    max_batch_chars = 100000
+    max_batch_items = 1000
+    max_concurrency = 64
+
+    def __init__(self, options=None):
+        super().__init__(options)
+        self.phrases = {}
+        path = self.options.get("path", "phrasebook.json")
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.phrases = self.mask_phrases(json.load(f))
+
+    def mask_phrases(self, phrases):
+        # The engine sends values with placeholders masked, so index every
+        # phrase under its masked form as well as the form written in the file.
+        masked_phrases = dict(phrases)
+        for source, translations in phrases.items():
+            masked, tokens = mask_placeholders(source)
+            if tokens:
+                masked_phrases.setdefault(masked, {
+                    lang: mask_with_tokens(translated, tokens) for lang, translated in translations.items()
+                })
+        return masked_phrases
+
+    def supported_languages(self):
+        if "languages" in self.options:
+            return self.options["languages"]
+        return {lang for translations in self.phrases.values() for lang in translations}
+
+    def create_client(self):
+        return PhrasebookClient(self.phrases)
+
+
+class LibreTranslateClient:
+    def __init__(self, url, api_key=None, timeout=30):
+        self.url = url.rstrip('/') + '/translate'
+        self.api_key = api_key
+        self.timeout = timeout
+
+    def translate(self, text, dest='en', src='auto'):
+        payload = {"q": text, "source": src, "target": dest.split('-')[0], "format": "text"}
+        if self.api_key:
+            payload["api_key"] = self.api_key
+        request = urllib.request.Request(
+            self.url, data=urllib.parse.urlencode(payload).encode('utf-8'),
+            headers={"Accept": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            data = json.loads(response.read().decode('utf-8'))
+        return Translation(data["translatedText"], dest, src)
+
+
+@register_backend
+class LibreTranslateBackend(TranslationBackend):
+    name = "libretranslate"
+    is_local = True
+    max_batch_chars = 20000
+    max_batch_items = 200
+    max_concurrency = 4
+
+    def create_client(self):
+        return LibreTranslateClient(
+            self.options.get("url", "http://localhost:5000"),
+            self.options.get("api_key"),
+            self.options.get("timeout", 30)
+        )
+
+
+class FailoverClient:
+    def __init__(self, backends):
+        self.backends = backends
+        self.clients = {}
+        self.used = {}
+        self.last_backend = None
+
+    def client(self, backend):
+        if backend.name not in self.clients:
+            self.clients[backend.name] = backend.create_client()
+        return self.clients[backend.name]
+
+    def translate(self, text, dest='en', src='auto'):
+        last_error = None
+        for backend in self.backends:
+            if not backend.supports(dest):
+                continue
+            try:
+                result = self.client(backend).translate(text, dest=dest)
+            except Exception as e:
+                last_error = e
+                continue
+            self.used[backend.name] = self.used.get(backend.name, 0) + 1
+            self.last_backend = backend.name
+            return result
+
+        if last_error is None:
+            raise TranslationUnavailable(f"No configured translation backend supports '{dest}'")
+        raise last_error
+
+
+def create_backends(settings):
+    names = settings.get("translation_backends", ["googletrans"])
+    options = settings.get("backend_options", {})
+    backends = []
+    for name in names:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown translation backend '{name}'. Available: {', '.join(sorted(BACKENDS))}")
+        backends.append(BACKENDS[name](options.get(name)))
+    return backends
@@ -0,0 +1,78 @@
+BATCH_SEPARATOR = "\n"
+
+
+def match_padding(source, translated):
+    # Services trim or pad lines on their own; keep exactly the source's padding.
+    start = len(source) - len(source.lstrip())
+    end = len(source.rstrip())
+    return source[:start] + translated.strip() + source[end:]
+
+
+def make_batches(texts, max_chars=4500, max_items=50):
+    batch = []
+    batch_chars = 0
+
+    for text in texts:
+        cost = len(text) + len(BATCH_SEPARATOR)
+        if batch and (batch_chars + cost > max_chars or len(batch) >= max_items):
+            yield batch
+            batch = []
+            batch_chars = 0
+        batch.append(text)
+        batch_chars += cost
+
+    if batch:
+        yield batch
+
+
+class BatchTranslator:
+    def __init__(self, translator, max_chars=4500, max_items=50):
+        self.translator = translator
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self.requests_sent = 0
+
+    def _translate_single(self, text, target_lang):
+        self.requests_sent += 1
+        return self.translator.translate(text, dest=target_lang).text
+
+    def _translate_batch(self, batch, target_lang):
+        if len(batch) == 1:
+            return [match_padding(batch[0], self._translate_single(batch[0], target_lang))]
+
+        self.requests_sent += 1
+        joined = BATCH_SEPARATOR.join(batch)
+        result = self.translator.translate(joined, dest=target_lang)
+        lines = result.text.split(BATCH_SEPARATOR)
+
+        if len(lines) == len(batch):
+            return [match_padding(text, line) for text, line in zip(batch, lines)]
+
+        # The service merged or split lines, so the results can't be mapped
+        # back by position. Halve the batch until every part lines up again.
+        middle = len(batch) // 2
+        return (self._translate_batch(batch[:middle], target_lang) +
+                self._translate_batch(batch[middle:], target_lang))
+
+    def translate_many(self, texts, target_lang, progress_callback=None):
+        results = {}
+        batchable = []
+
+        for text in texts:
+            if text in results:
+                continue
+            if BATCH_SEPARATOR in text or not text.strip():
+                results[text] = self._translate_single(text, target_lang) if text.strip() else text
+            else:
+                batchable.append(text)
+                results[text] = None
+
+        done = len(results) - len(batchable)
+        for batch in make_batches(batchable, self.max_chars, self.max_items):
+            for text, translated in zip(batch, self._translate_batch(batch, target_lang)):
+                results[text] = translated
+            done += len(batch)
+            if progress_callback:
+                progress_callback(done, len(results))
+
+        return results
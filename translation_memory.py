@@ -0,0 +1,122 @@
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+class TranslationMemory:
+    def __init__(self, db_path="translation_memory.db", max_entries=10000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            "source_text TEXT NOT NULL, "
+            "source_lang TEXT NOT NULL, "
+            "target_lang TEXT NOT NULL, "
+            "translated_text TEXT NOT NULL, "
+            "PRIMARY KEY (source_text, source_lang, target_lang))"
+        )
+        self._conn.commit()
+
+    def _remember(self, cache_key, translated_text):
+        self._lru[cache_key] = translated_text
+        self._lru.move_to_end(cache_key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get(self, text, target_lang, source_lang="auto"):
+        cache_key = (text, source_lang, target_lang)
+
+        with self._lock:
+            if cache_key in self._lru:
+                self._lru.move_to_end(cache_key)
+                self.hits += 1
+                return self._lru[cache_key]
+
+            row = self._conn.execute(
+                "SELECT translated_text FROM translations "
+                "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                cache_key
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._remember(cache_key, row[0])
+            return row[0]
+
+    def peek(self, text, target_lang, source_lang="auto"):
+        cache_key = (text, source_lang, target_lang)
+
+        with self._lock:
+            if cache_key in self._lru:
+                return self._lru[cache_key]
+
+            row = self._conn.execute(
+                "SELECT translated_text FROM translations "
+                "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                cache_key
+            ).fetchone()
+            return row[0] if row else None
+
+    def put(self, text, target_lang, translated_text, source_lang="auto"):
+        cache_key = (text, source_lang, target_lang)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations "
+                "(source_text, source_lang, target_lang, translated_text) VALUES (?, ?, ?, ?)",
+                cache_key + (translated_text,)
+            )
+            self._conn.commit()
+            self._remember(cache_key, translated_text)
+
+    def put_many(self, translations, target_lang, source_lang="auto"):
+        rows = [(text, source_lang, target_lang, translated_text)
+                for text, translated_text in translations.items()]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations "
+                "(source_text, source_lang, target_lang, translated_text) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+            for row in rows:
+                self._remember(row[:3], row[3])
+
+    def discard_many(self, texts, target_lang, source_lang="auto"):
+        rows = [(text, source_lang, target_lang) for text in texts]
+
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM translations "
+                "WHERE source_text = ? AND source_lang = ? AND target_lang = ?",
+                rows
+            )
+            self._conn.commit()
+            for row in rows:
+                self._lru.pop(row, None)
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats_text(self):
+        return f"cache {self.hits} hits / {self.misses} misses"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
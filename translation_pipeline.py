@@ -0,0 +1,140 @@
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import Metrics
+from translation_backends import TranslationUnavailable
+
+
+class TranslationFailed(Exception):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = self.capacity
+        self.updated = None
+        self.waits = 0
+        self._lock = None
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self.updated is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - started
+
+                self.waits += 1
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class TranslationPipeline:
+    def __init__(self, translator_factory, requests_per_second=5.0, burst=10, max_in_flight=8,
+                 max_retries=4, base_delay=0.5, max_delay=30.0, metrics=None):
+        self.translator_factory = translator_factory
+        self.metrics = metrics or Metrics()
+        self.rate_limiter = TokenBucket(requests_per_second, burst)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retries = 0
+        self.failures = 0
+        self._semaphore = None
+        self._clients = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+
+    def _call(self, text, dest):
+        client = getattr(self._clients, 'translator', None)
+        if client is None:
+            client = self.translator_factory()
+            self._clients.translator = client
+
+        self.metrics.count("requests")
+        self.metrics.count("request_characters", len(text))
+        start = time.perf_counter()
+        try:
+            result = client.translate(text, dest=dest)
+        except Exception:
+            self.metrics.count("request_errors")
+            raise
+        backend = getattr(client, 'last_backend', None) or type(client).__name__
+        self.metrics.record_request(backend, dest, time.perf_counter() - start)
+        return result
+
+    def backoff_delay(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def translate(self, text, dest):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        loop = asyncio.get_event_loop()
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            waited = await self.rate_limiter.acquire()
+            if waited:
+                self.metrics.record("rate_limit_wait", waited)
+            try:
+                async with self._semaphore:
+                    return await loop.run_in_executor(self._executor, self._call, text, dest)
+            except TranslationUnavailable:
+                raise
+            except Exception as e:
+                last_error = e
+
+            if attempt < self.max_retries:
+                self.retries += 1
+                self.metrics.count("retries")
+                delay = self.backoff_delay(attempt)
+                self.metrics.record("retry_backoff", delay)
+                await asyncio.sleep(delay)
+
+        self.failures += 1
+        self.metrics.count("request_failures")
+        raise TranslationFailed(f"Gave up after {self.max_retries + 1} attempts: {str(last_error)}")
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+
+class PipelineBridge:
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, text, dest):
+        return asyncio.run_coroutine_threadsafe(self.pipeline.translate(text, dest), self.loop)
+
+    def translate(self, text, dest='en'):
+        return self.submit(text, dest).result()
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.pipeline.shutdown()
+        self.loop.close()
@@ -0,0 +1,91 @@
+import re
+
+from placeholders import PLACEHOLDER_PATTERN
+
+NUMBER_PATTERN = r'^[\s\d.,:;%+\-/()#]*$'
+URL_PATTERN = r'^\s*(?:(?:https?|ftp)://|www\.|mailto:)\S*\s*$|^\s*[\w.+-]+@[\w-]+\.[\w.-]+\s*$'
+
+DEFAULT_SKIP_RULES = {
+    "numbers": True,
+    "urls": True,
+    "placeholders_only": True,
+    "patterns": []
+}
+
+
+class SkipRules:
+    def __init__(self, rules=None):
+        rules = dict(DEFAULT_SKIP_RULES, **(rules or {}))
+        self.skip_numbers = rules["numbers"]
+        self.skip_urls = rules["urls"]
+        self.skip_placeholders_only = rules["placeholders_only"]
+        self._number = re.compile(NUMBER_PATTERN)
+        self._url = re.compile(URL_PATTERN, re.IGNORECASE)
+        self._placeholder = re.compile(PLACEHOLDER_PATTERN)
+        self._patterns = [re.compile(pattern) for pattern in rules["patterns"]]
+
+    def should_skip(self, value):
+        if not value.strip():
+            return True
+        if self.skip_numbers and self._number.match(value):
+            return True
+        if self.skip_urls and self._url.match(value):
+            return True
+        if self.skip_placeholders_only and not any(
+                char.isalpha() for char in self._placeholder.sub('', value)):
+            return True
+        return any(pattern.search(value) for pattern in self._patterns)
+
+
+class TranslationPlan:
+    def __init__(self, skip_rules):
+        self.skip_rules = skip_rules
+        self.targets = {}
+        self.requested = 0
+        self.skipped = 0
+        self._skip_cache = {}
+
+    def target(self, target_lang):
+        if target_lang not in self.targets:
+            self.targets[target_lang] = {
+                'translations': {},
+                'values': [],
+                'seen': set(),
+                'combinations': []
+            }
+        return self.targets[target_lang]
+
+    def add(self, combination, target_lang, values):
+        target = self.target(target_lang)
+        target['combinations'].append(combination)
+
+        for value in values:
+            self.requested += 1
+            if value in target['seen']:
+                continue
+            target['seen'].add(value)
+
+            skip = self._skip_cache.get(value)
+            if skip is None:
+                skip = self.skip_rules.should_skip(value)
+                self._skip_cache[value] = skip
+
+            if skip:
+                self.skipped += 1
+                target['translations'][value] = value
+            else:
+                target['values'].append(value)
+
+        return target
+
+    def unique_pairs(self):
+        return sum(len(target['seen']) for target in self.targets.values())
+
+    def stats(self):
+        unique = self.unique_pairs()
+        return {
+            "requested": self.requested,
+            "unique": unique,
+            "duplicates": self.requested - unique,
+            "skipped": self.skipped
+        }
@@ -0,0 +1,160 @@
+import multiprocessing
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from glossary import load_glossary
+from incremental import index_entries
+from placeholders import find_placeholders
+from properties_io import SPECIAL_KEYS, iter_properties
+from translation_plan import SkipRules
+
+ISSUE_TYPES = ("missing", "extra", "duplicate", "untranslated", "placeholders", "encoding", "length")
+RETRANSLATE_ISSUES = ("missing", "untranslated", "placeholders", "encoding", "length")
+DEFAULT_MAX_LENGTH_RATIO = 3.0
+MIN_LENGTH_BASE = 10
+SOURCE_CACHE_SIZE = 32
+
+_state = {}
+
+
+def init_worker(options):
+    _state.clear()
+    _state["skip_rules"] = SkipRules(options.get("skip_rules"))
+    _state["glossary"] = load_glossary(options.get("glossary_path"))
+    _state["max_length_ratio"] = options.get("max_length_ratio", DEFAULT_MAX_LENGTH_RATIO)
+    _state["allow_identical"] = {language: set(values) for language, values in options.get("allow_identical", {}).items()}
+    _state["sources"] = {}
+
+
+def verification_options(settings):
+    return {
+        "skip_rules": settings.get("skip_rules"),
+        "glossary_path": settings.get("glossary_path", "glossary.json"),
+        "max_length_ratio": settings.get("verify_max_length_ratio", DEFAULT_MAX_LENGTH_RATIO),
+        "allow_identical": settings.get("verify_allow_identical", {})
+    }
+
+
+def verification_tasks(sources, languages, source_language):
+    return [(source_path, language, languages[language], output_path, language != source_language)
+            for source_path, combinations in sources
+            for language, output_path in combinations]
+
+
+def read_entries(path):
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8-sig', errors='replace')
+    return list(iter_properties(text.split('\n')))
+
+
+def load_source(path):
+    sources = _state["sources"]
+    if path not in sources:
+        if len(sources) >= SOURCE_CACHE_SIZE:
+            sources.clear()
+        sources[path] = {key: (value, sorted(find_placeholders(value)))
+                         for key, value in index_entries(read_entries(path)).items()}
+    return sources[path]
+
+
+def is_mojibake(value):
+    if value.isascii():
+        return False
+    try:
+        return value.encode('cp1252').decode('utf-8') != value
+    except UnicodeError:
+        return False
+
+
+def has_encoding_issue(value, source_value):
+    if '\ufffd' in value and '\ufffd' not in source_value:
+        return True
+    return is_mojibake(value) and not is_mojibake(source_value)
+
+
+def identical_allowed(value, language, target_lang):
+    allow_identical = _state["allow_identical"]
+    if value in allow_identical.get(language, ()) or value in allow_identical.get("*", ()):
+        return True
+    if _state["skip_rules"].should_skip(value):
+        return True
+    glossary = _state["glossary"]
+    return glossary is not None and glossary.resolve(value, target_lang) == value
+
+
+def verify_output(task):
+    source_path, language, target_lang, output_path, translated = task
+    source = load_source(source_path)
+    issues = {name: [] for name in ISSUE_TYPES}
+    result = {
+        "source_path": source_path,
+        "language": language,
+        "output_path": output_path,
+        "exists": os.path.exists(output_path),
+        "keys": 0,
+        "issues": issues
+    }
+
+    if not result["exists"]:
+        issues["missing"] = list(source)
+        result["retranslate"] = list(source)
+        return result
+
+    entries = read_entries(output_path)
+    counts = Counter(key for key, value in entries if key not in SPECIAL_KEYS)
+    output_index = index_entries(entries)
+    result["keys"] = len(output_index)
+    max_length_ratio = _state["max_length_ratio"]
+
+    for key, (source_value, source_placeholders) in source.items():
+        if key not in output_index:
+            issues["missing"].append(key)
+            continue
+        value = output_index[key]
+        if has_encoding_issue(value, source_value):
+            issues["encoding"].append(key)
+        if sorted(find_placeholders(value)) != source_placeholders:
+            issues["placeholders"].append(key)
+        if not translated:
+            continue
+        if value == source_value:
+            if not identical_allowed(source_value, language, target_lang):
+                issues["untranslated"].append(key)
+        elif len(value) > max_length_ratio * max(len(source_value), MIN_LENGTH_BASE):
+            issues["length"].append(key)
+
+    issues["extra"] = [key for key in output_index if key not in source]
+    issues["duplicate"] = [key for key, count in counts.items() if count > 1]
+
+    failing = set()
+    for name in RETRANSLATE_ISSUES:
+        failing.update(issues[name])
+    result["retranslate"] = [key for key in source if key in failing]
+    return result
+
+
+def verify_outputs(tasks, options, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1 or len(tasks) < 2:
+        init_worker(options)
+        return [verify_output(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    # The engine already runs background threads, so workers are not forked from it directly.
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    with ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context(method),
+                             initializer=init_worker, initargs=(options,)) as executor:
+        return list(executor.map(verify_output, tasks, chunksize=chunksize))
+
+
+def summarize(results):
+    totals = {name: 0 for name in ISSUE_TYPES}
+    failed_files = 0
+    for result in results:
+        counts = {name: len(keys) for name, keys in result["issues"].items()}
+        if any(counts.values()):
+            failed_files += 1
+        for name, count in counts.items():
+            totals[name] += count
+    return {"files": len(results), "failed_files": failed_files, "issues": totals}